@@ -5,6 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from backend.services.db_service import country_write
 from backend.services.military_service import military_service
 
 
@@ -74,6 +75,7 @@ async def get_deployment_zone(country_code: str, zone_id: str):
 
 
 @router.post("/deployments/{country_code}/deploy")
+@country_write
 async def deploy_troops(country_code: str, request: DeployTroopsRequest):
     """Deploy troops to a border zone."""
     result = military_service.deploy_troops(
@@ -90,6 +92,7 @@ async def deploy_troops(country_code: str, request: DeployTroopsRequest):
 
 
 @router.post("/deployments/{country_code}/withdraw")
+@country_write
 async def withdraw_troops(country_code: str, request: WithdrawTroopsRequest):
     """Withdraw troops from a border zone."""
     result = military_service.withdraw_troops(
@@ -106,6 +109,7 @@ async def withdraw_troops(country_code: str, request: WithdrawTroopsRequest):
 
 
 @router.post("/deployments/{country_code}/alert")
+@country_write
 async def set_zone_alert_level(country_code: str, request: SetAlertLevelRequest):
     """Set alert level for a border zone."""
     result = military_service.set_alert_level(
@@ -125,6 +129,7 @@ async def set_zone_alert_level(country_code: str, request: SetAlertLevelRequest)
 # =============================================================================
 
 @router.post("/reserves/{country_code}/callup")
+@country_write
 async def callup_reserves(country_code: str, request: CallupReservesRequest):
     """Call up reserve personnel."""
     result = military_service.callup_reserves(
@@ -140,6 +145,7 @@ async def callup_reserves(country_code: str, request: CallupReservesRequest):
 
 
 @router.post("/reserves/{country_code}/stand-down")
+@country_write
 async def stand_down_reserves(country_code: str, request: StandDownReservesRequest):
     """Release reserve personnel back to civilian status."""
     result = military_service.stand_down_reserves(
@@ -5,6 +5,10 @@ from pathlib import Path
 class GameConfig(BaseSettings):
     # Paths
     DB_PATH: Path = Path("db")
+    # Pretty-printed saves are readable but skip json's C encoder (~4x slower)
+    DB_PRETTY_JSON: bool = True
+    DB_READ_CACHE_SIZE: int = 32  # Parsed countries kept for read-only endpoints
+    MAP_CACHE_SIZE: int = 32  # Countries whose map layers MapService keeps loaded
 
     # Game Clock
     REAL_SECONDS_PER_GAME_DAY: float = 1.0  # 1 real second = 1 game day
@@ -20,6 +24,7 @@ class GameConfig(BaseSettings):
     # API
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
+    API_ACCESS_LOG: bool = False  # Per-request log lines cost noticeable throughput
 
     class Config:
         env_file = ".env"
@@ -46,6 +46,14 @@ class ClockService:
             TickType.YEARLY: [],
         }
 
+        # Handlers called once per day with every tick type that fired
+        self.batch_handlers: List[Callable] = []
+
+        # Last day whose handlers have finished; _day_event is set (and
+        # replaced) each time it advances
+        self._processed_day: int = 0
+        self._day_event = asyncio.Event()
+
     def register_handler(self, tick_type: str, handler: Callable) -> None:
         """
         Register a function to be called on specific tick type.
@@ -62,6 +70,24 @@ class ClockService:
         if tick_type in self.tick_handlers and handler in self.tick_handlers[tick_type]:
             self.tick_handlers[tick_type].remove(handler)
 
+    def register_batch_handler(self, handler: Callable) -> None:
+        """
+        Register a function to be called once per day with all fired tick types.
+
+        Lets a subscriber coalesce work (e.g. one load/save) when several
+        tick types land on the same game day. Batch handlers run
+        concurrently with each other, so they must not share mutable state.
+
+        Args:
+            handler: Async function(game_date: date, day_count: int, tick_types: List[str])
+        """
+        self.batch_handlers.append(handler)
+
+    def unregister_batch_handler(self, handler: Callable) -> None:
+        """Remove a registered batch handler."""
+        if handler in self.batch_handlers:
+            self.batch_handlers.remove(handler)
+
     async def advance_day(self) -> Dict[str, bool]:
         """
         Advance game by one day and trigger appropriate ticks.
@@ -75,38 +101,49 @@ class ClockService:
         self.day_count += 1
         self.current_date += timedelta(days=1)
 
-        triggered = {
-            TickType.DAILY: True,
-            TickType.WEEKLY: False,
-            TickType.MONTHLY: False,
-            TickType.QUARTERLY: False,
-            TickType.YEARLY: False,
-        }
-
         # Always trigger daily
-        await self._trigger_handlers(TickType.DAILY)
+        fired = [TickType.DAILY]
 
         # Check for weekly (every 7 days)
         if self.day_count % 7 == 0:
-            triggered[TickType.WEEKLY] = True
-            await self._trigger_handlers(TickType.WEEKLY)
+            fired.append(TickType.WEEKLY)
 
         # Check for monthly (first of month)
         if self.current_date.day == 1:
-            triggered[TickType.MONTHLY] = True
-            await self._trigger_handlers(TickType.MONTHLY)
+            fired.append(TickType.MONTHLY)
 
             # Check for quarterly (Jan, Apr, Jul, Oct)
             if self.current_date.month in [1, 4, 7, 10]:
-                triggered[TickType.QUARTERLY] = True
-                await self._trigger_handlers(TickType.QUARTERLY)
+                fired.append(TickType.QUARTERLY)
 
             # Check for yearly (January)
             if self.current_date.month == 1:
-                triggered[TickType.YEARLY] = True
-                await self._trigger_handlers(TickType.YEARLY)
+                fired.append(TickType.YEARLY)
 
-        return triggered
+        for tick_type in fired:
+            await self._trigger_handlers(tick_type)
+
+        await self._trigger_batch_handlers(fired)
+
+        # Wake everyone waiting on this day, then arm a fresh event for the next
+        self._processed_day = self.day_count
+        self._day_event.set()
+        self._day_event = asyncio.Event()
+
+        return {tick_type: tick_type in fired for tick_type in self.tick_handlers}
+
+    async def wait_for_day(self, after: int) -> int:
+        """
+        Wait until a day later than `after` has been fully processed.
+
+        Returns immediately if that has already happened.
+
+        Returns:
+            The last processed day_count
+        """
+        while self._processed_day <= after:
+            await self._day_event.wait()
+        return self._processed_day
 
     async def _trigger_handlers(self, tick_type: str) -> None:
         """Trigger all handlers for a tick type."""
@@ -116,6 +153,16 @@ class ClockService:
             except Exception as e:
                 print(f"Error in {tick_type} handler: {e}")
 
+    async def _trigger_batch_handlers(self, tick_types: List[str]) -> None:
+        """Trigger all batch handlers concurrently with the tick types fired today."""
+        results = await asyncio.gather(
+            *(handler(self.current_date, self.day_count, tick_types) for handler in self.batch_handlers),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error in batch tick handler: {result}")
+
     async def run(self) -> None:
         """Main game loop - runs continuously."""
         self._running = True
@@ -5,7 +5,7 @@ Generates and manages events based on KPI thresholds.
 """
 
 import random
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -179,6 +179,8 @@ class EventEngine:
     def __init__(self, country_data: dict, event_catalog: Optional[dict] = None):
         self.data = country_data
         self.catalog = event_catalog or self.DEFAULT_EVENTS
+        # (hostile, good, alliances) while check_events runs; see _relation_tallies
+        self._tallies: Optional[Tuple[int, int, int]] = None
 
     def check_events(self) -> List[Dict]:
         """
@@ -188,12 +190,18 @@ class EventEngine:
         """
         triggered = []
 
-        for event_id, event_def in self.catalog.items():
-            probability = self._calculate_probability(event_def)
+        # Relations don't change while probabilities are computed, so every
+        # relation condition in the catalog shares one pass over them
+        self._tallies = self._tally_relations()
+        try:
+            for event_id, event_def in self.catalog.items():
+                probability = self._calculate_probability(event_def)
 
-            if random.random() < probability:
-                event_instance = self._create_event_instance(event_id, event_def)
-                triggered.append(event_instance)
+                if random.random() < probability:
+                    event_instance = self._create_event_instance(event_id, event_def)
+                    triggered.append(event_instance)
+        finally:
+            self._tallies = None
 
         return triggered
 
@@ -297,25 +305,37 @@ class EventEngine:
             return float(current)
         return current
 
+    def _tally_relations(self) -> Tuple[int, int, int]:
+        """Count hostile, good and allied relations in a single pass."""
+        hostile = good = alliances = 0
+        for r in self.data.get('relations', {}).values():
+            score = r.get('score', 0)
+            if score < -20:
+                hostile += 1
+            elif score > 50:
+                good += 1
+            for t in r.get('treaties', []):
+                t = t.lower()
+                if 'alliance' in t or 'defense' in t:
+                    alliances += 1
+                    break
+        return hostile, good, alliances
+
+    def _relation_tallies(self) -> Tuple[int, int, int]:
+        """Relation counts, shared across one check_events run."""
+        return self._tallies or self._tally_relations()
+
     def _count_hostile_relations(self) -> int:
         """Count countries with negative relations."""
-        relations = self.data.get('relations', {})
-        return sum(1 for r in relations.values() if r.get('score', 0) < -20)
+        return self._relation_tallies()[0]
 
     def _count_good_relations(self) -> int:
         """Count countries with positive relations."""
-        relations = self.data.get('relations', {})
-        return sum(1 for r in relations.values() if r.get('score', 0) > 50)
+        return self._relation_tallies()[1]
 
     def _count_alliances(self) -> int:
         """Count formal alliances."""
-        relations = self.data.get('relations', {})
-        count = 0
-        for r in relations.values():
-            treaties = r.get('treaties', [])
-            if any('alliance' in t.lower() or 'defense' in t.lower() for t in treaties):
-                count += 1
-        return count
+        return self._relation_tallies()[2]
 
     def _create_event_instance(self, event_id: str, event_def: dict) -> Dict:
         """Create an active event instance."""
@@ -14,7 +14,7 @@ from backend.models.active_operation import (
     ActiveOperation, OperationType, OperationStatus, OperationResult as OpResult
 )
 from backend.services.map_service import map_service
-from backend.engine.unit_engine import UnitEngine
+from backend.engine.unit_engine import get_unit_engine
 
 
 class OperationError(Exception):
@@ -138,7 +138,7 @@ class LocationOperationsEngine:
 
     def __init__(self, country_code: str):
         self.country_code = country_code.upper()
-        self.unit_engine = UnitEngine(country_code)
+        self.unit_engine = get_unit_engine(country_code)
 
     def _validate_units_for_operation(
         self,
@@ -439,13 +439,12 @@ class LocationOperationsEngine:
         updates = []
         ops_list = map_service.load_operations(self.country_code)
 
-        for operation in ops_list.operations:
-            if not operation.is_active():
-                continue
-
-            update = self._process_single_operation(operation, current_time)
-            if update:
-                updates.append(update)
+        # One write per file for the whole tick, not one per operation
+        with map_service.batch_writes():
+            for operation in ops_list.get_active():
+                update = self._process_single_operation(operation, current_time)
+                if update:
+                    updates.append(update)
 
         return updates
 
@@ -511,6 +510,7 @@ class LocationOperationsEngine:
 
         # Calculate losses
         friendly_losses = {}
+        status_updates = {}
         unit_list = map_service.load_units(self.country_code)
 
         for unit_id in operation.assigned_unit_ids:
@@ -531,8 +531,7 @@ class LocationOperationsEngine:
                     damage *= 1.5
 
                 # Apply damage
-                self.unit_engine.update_unit_status(
-                    unit_id,
+                status_updates[unit_id] = dict(
                     health_delta=-damage,
                     fuel_delta=-config.get('fuel_consumption', 20),
                     ammo_delta=-config.get('ammo_consumption', 20),
@@ -544,13 +543,14 @@ class LocationOperationsEngine:
                     friendly_losses[unit.unit_type] = friendly_losses.get(unit.unit_type, 0) + 1
             else:
                 # No damage, just resource consumption
-                self.unit_engine.update_unit_status(
-                    unit_id,
+                status_updates[unit_id] = dict(
                     fuel_delta=-config.get('fuel_consumption', 20) * 0.5,
                     ammo_delta=-config.get('ammo_consumption', 20) * 0.5,
                     experience_delta=3 if success else 1
                 )
 
+        self.unit_engine.update_unit_status_bulk(status_updates)
+
         # Calculate enemy casualties
         enemy_casualties = 0
         enemy_equipment = {}
@@ -631,7 +631,9 @@ class LocationOperationsEngine:
 
         by_status = {}
         by_type = {}
+        active = 0
 
+        # One pass for every count instead of a second scan for get_active()
         for op in ops_list.operations:
             status = op.status.value
             by_status[status] = by_status.get(status, 0) + 1
@@ -639,9 +641,12 @@ class LocationOperationsEngine:
             op_type = op.operation_type.value
             by_type[op_type] = by_type.get(op_type, 0) + 1
 
+            if op.is_active():
+                active += 1
+
         return {
             'total': len(ops_list.operations),
-            'active': len(ops_list.get_active()),
+            'active': active,
             'by_status': by_status,
             'by_type': by_type
         }
@@ -4,10 +4,16 @@ Procurement Engine - Phase 6
 Allows player to purchase weapons and military equipment.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from backend.engine.constraint_engine import ConstraintEngine
 
 
+# (raw catalog, flat catalog, category index) for the last catalog flattened.
+# The API and tick processor pass the same cached catalog dict every time,
+# so flattening and indexing only rerun when the catalog itself changes.
+_catalog_views: Optional[Tuple[dict, dict, Dict[Optional[str], dict]]] = None
+
+
 class ProcurementEngine:
     """
     Manages military procurement.
@@ -23,9 +29,17 @@ class ProcurementEngine:
         self.data = country_data
         self.raw_catalog = weapons_catalog
         # Flatten the catalog for easy weapon lookup
-        self.catalog = self._flatten_catalog(weapons_catalog)
+        self.catalog, self._catalog_by_category = self._get_catalog_views(weapons_catalog)
         self.constraint_engine = ConstraintEngine(country_data)
 
+    def _get_catalog_views(self, catalog: dict) -> Tuple[dict, Dict[Optional[str], dict]]:
+        """Return the flat catalog and its category index, reusing the last build."""
+        global _catalog_views
+        if _catalog_views is None or _catalog_views[0] is not catalog:
+            flat = self._flatten_catalog(catalog)
+            _catalog_views = (catalog, flat, self._index_by_category(flat))
+        return _catalog_views[1], _catalog_views[2]
+
     def _flatten_catalog(self, catalog: dict) -> dict:
         """Flatten nested catalog structure into weapon_id -> weapon dict."""
         flat = {}
@@ -65,36 +79,35 @@ class ProcurementEngine:
 
         return flat
 
+    @staticmethod
+    def _index_by_category(flat: dict) -> Dict[Optional[str], dict]:
+        """
+        Pre-slice the flat catalog by category in one pass.
+
+        The None key holds the unfiltered listing. Nested catalogs are
+        flattened under both full and short IDs; only full IDs are listed
+        to avoid duplicates.
+        """
+        has_nested_format = any('.' in k for k in flat)
+
+        index: Dict[Optional[str], dict] = {None: {}}
+        for k, v in flat.items():
+            if has_nested_format and '.' not in k:
+                continue
+            index[None][k] = v
+            index.setdefault(v.get('category'), {})[k] = v
+        return index
+
     def get_catalog(self, category: Optional[str] = None) -> Dict:
         """
         Get available weapons catalog.
 
+        The returned dict is shared between engines and must not be mutated.
+
         Args:
             category: Optional filter by category (aircraft, armor, naval, infantry, etc.)
         """
-        # Check if this is a nested catalog (has both short and full IDs from flattening)
-        has_nested_format = any('.' in k for k in self.catalog.keys())
-
-        if category:
-            if has_nested_format:
-                # Nested format - only return full IDs to avoid duplicates
-                return {
-                    k: v for k, v in self.catalog.items()
-                    if v.get('category') == category and '.' in k
-                }
-            else:
-                # Flat format - return all matching category
-                return {
-                    k: v for k, v in self.catalog.items()
-                    if v.get('category') == category
-                }
-
-        if has_nested_format:
-            # Nested format - only return full IDs to avoid duplicates
-            return {k: v for k, v in self.catalog.items() if '.' in k}
-        else:
-            # Flat format - return all items
-            return self.catalog.copy()
+        return self._catalog_by_category.get(category or None, {})
 
     def check_purchase_eligibility(self, weapon_id: str, quantity: int) -> Dict:
         """
@@ -290,8 +303,8 @@ class ProcurementEngine:
                 if project['delivered'] >= project.get('quantity', 0):
                     project['status'] = 'completed'
 
-        # Clean up completed orders
-        self.data['active_projects'] = [
+        # Clean up completed orders (in place, the list is shared with SectorEngine)
+        projects[:] = [
             p for p in projects
             if not (p.get('type') == 'weapon_procurement' and p.get('status') == 'completed')
         ]
@@ -506,7 +519,7 @@ class ProcurementEngine:
                         )
 
                 project['status'] = 'cancelled'
-                self.data['active_projects'] = [
+                projects[:] = [
                     p for p in projects if p.get('id') != order_id
                 ]
 
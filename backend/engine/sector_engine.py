@@ -4,10 +4,44 @@ Sector Engine - Phase 5
 Allows player to invest in economic sectors and manage development projects.
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 from backend.engine.constraint_engine import ConstraintEngine
 
 
+@dataclass(frozen=True, slots=True)
+class SectorDef:
+    """Attribute-access view of a SECTOR_REQUIREMENTS entry."""
+    workforce: Dict[str, int]
+    infrastructure: Dict[str, float]
+    cost_per_level: float
+
+
+@dataclass(frozen=True, slots=True)
+class InfraDef:
+    """Attribute-access view of an INFRASTRUCTURE_PROJECTS entry."""
+    cost: float
+    duration_quarters: int
+    effects: Dict[str, Any]
+    default_name: str
+
+
+# Sectors without an entry in SECTOR_REQUIREMENTS: budget only, default cost
+_DEFAULT_SECTOR = SectorDef(workforce={}, infrastructure={}, cost_per_level=0.5)
+
+
+# Dotted effect paths pre-split into key tuples (seeded from INFRASTRUCTURE_PROJECTS)
+_EFFECT_KEYS: Dict[str, Tuple[str, ...]] = {}
+
+
+def _effect_keys(path: str) -> Tuple[str, ...]:
+    """Get the key tuple for a dotted effect path, splitting it only once."""
+    keys = _EFFECT_KEYS.get(path)
+    if keys is None:
+        keys = _EFFECT_KEYS[path] = tuple(path.split('.'))
+    return keys
+
+
 class SectorEngine:
     """
     Manages sector development and investment.
@@ -129,6 +163,11 @@ class SectorEngine:
     def __init__(self, country_data: dict):
         self.data = country_data
         self.constraint_engine = ConstraintEngine(country_data)
+        self._check_all = self.constraint_engine.check_all
+        self._check_budget = self.constraint_engine.check_budget
+        self._projects: List[Dict] = country_data.setdefault('active_projects', [])
+        self._budget: Dict = country_data.setdefault('budget', {})
+        self._budget.setdefault('allocation', {})
 
     def invest_in_sector(
         self,
@@ -158,36 +197,48 @@ class SectorEngine:
         if current_level >= 100:
             return {'success': False, 'error': f'{sector_name} already at maximum level'}
 
+        if investment_billions <= 0:
+            return {'success': False, 'error': 'Investment must be positive'}
+
         # Get sector requirements
-        requirements = self.SECTOR_REQUIREMENTS.get(sector_name, {})
+        sector_def = _SECTOR_DEFS.get(sector_name, _DEFAULT_SECTOR)
+        cost_per_level = sector_def.cost_per_level
 
-        # Build constraints
-        constraints = {
-            'budget': {
-                'amount_billions': investment_billions,
-                'budget_category': 'development'
+        # Anything below one level's cost would yield a zero-improvement project
+        if investment_billions < cost_per_level:
+            return {
+                'success': False,
+                'error': f'Minimum investment for {sector_name} is ${cost_per_level:.2f}B'
+            }
+
+        # Check constraints (budget-only sectors skip the check_all dispatch)
+        if sector_def.workforce or sector_def.infrastructure:
+            constraints = {
+                'budget': {
+                    'amount_billions': investment_billions,
+                    'budget_category': 'development'
+                }
             }
-        }
 
-        if requirements.get('workforce'):
-            constraints['workforce'] = requirements['workforce']
+            if sector_def.workforce:
+                constraints['workforce'] = sector_def.workforce
 
-        if requirements.get('infrastructure'):
-            constraints['infrastructure'] = requirements['infrastructure']
+            if sector_def.infrastructure:
+                constraints['infrastructure'] = sector_def.infrastructure
 
-        # Check constraints
-        can_invest, results = self.constraint_engine.check_all(constraints)
+            can_invest, results = self._check_all(constraints)
+        else:
+            budget_result = self._check_budget(investment_billions, 'development')
+            can_invest, results = budget_result.satisfied, [budget_result]
 
         if not can_invest:
-            failed = [r for r in results if not r.satisfied]
             return {
                 'success': False,
                 'error': 'Constraints not met',
-                'failed_constraints': [r.to_dict() for r in failed]
+                'failed_constraints': [r.to_dict() for r in results if not r.satisfied]
             }
 
         # Calculate project duration
-        cost_per_level = requirements.get('cost_per_level', 0.5)
         efficiency = investment_billions / (cost_per_level * target_improvement)
         base_quarters = 4
         time_quarters = max(2, int(base_quarters / max(0.5, efficiency)))
@@ -201,8 +252,10 @@ class SectorEngine:
 
         # Create project
         current_date = self.data.get('meta', {}).get('current_date', {})
+        year = current_date.get('year', 2024)
+        month = current_date.get('month', 1)
         project = {
-            'id': f"sector_{sector_name}_{current_date.get('year', 2024)}_{current_date.get('month', 1)}",
+            'id': f"sector_{sector_name}_{year}_{month}",
             'type': 'sector_development',
             'sector': sector_name,
             'investment': investment_billions,
@@ -214,9 +267,7 @@ class SectorEngine:
         }
 
         # Add to active projects
-        if 'active_projects' not in self.data:
-            self.data['active_projects'] = []
-        self.data['active_projects'].append(project)
+        self._projects.append(project)
 
         # Deduct from development budget
         self._deduct_budget(investment_billions)
@@ -243,18 +294,18 @@ class SectorEngine:
             project_type: Type from INFRASTRUCTURE_PROJECTS
             custom_name: Optional custom name for the project
         """
-        if project_type not in self.INFRASTRUCTURE_PROJECTS:
+        project_def = _INFRA_DEFS.get(project_type)
+        if project_def is None:
             return {
                 'success': False,
                 'error': f'Unknown project type: {project_type}',
                 'available_types': list(self.INFRASTRUCTURE_PROJECTS.keys())
             }
 
-        project_def = self.INFRASTRUCTURE_PROJECTS[project_type]
-        cost = project_def['cost']
+        cost = project_def.cost
 
         # Check budget
-        budget_result = self.constraint_engine.check_budget(cost, 'infrastructure')
+        budget_result = self._check_budget(cost, 'infrastructure')
         if not budget_result.satisfied:
             return {
                 'success': False,
@@ -263,23 +314,23 @@ class SectorEngine:
 
         # Create project
         current_date = self.data.get('meta', {}).get('current_date', {})
+        year = current_date.get('year', 2024)
+        month = current_date.get('month', 1)
         project = {
-            'id': f"infra_{project_type}_{current_date.get('year', 2024)}_{current_date.get('month', 1)}",
+            'id': f"infra_{project_type}_{year}_{month}",
             'type': 'infrastructure',
             'subtype': project_type,
-            'name': custom_name or project_type.replace('_', ' ').title(),
+            'name': custom_name or project_def.default_name,
             'cost': cost,
-            'effects': project_def['effects'],
+            'effects': project_def.effects,
             'start_date': current_date.copy(),
-            'duration_quarters': project_def['duration_quarters'],
-            'quarters_remaining': project_def['duration_quarters'],
+            'duration_quarters': project_def.duration_quarters,
+            'quarters_remaining': project_def.duration_quarters,
             'status': 'in_progress'
         }
 
         # Add to active projects
-        if 'active_projects' not in self.data:
-            self.data['active_projects'] = []
-        self.data['active_projects'].append(project)
+        self._projects.append(project)
 
         # Deduct budget
         self._deduct_budget(cost)
@@ -297,28 +348,33 @@ class SectorEngine:
             List of completed projects
         """
         completed = []
-        projects = self.data.get('active_projects', [])
+        projects = self._projects
 
+        # Single pass: compact surviving projects towards the front, in place
+        keep = 0
         for project in projects:
-            if project.get('status') != 'in_progress':
+            status = project.get('status')
+
+            if status == 'in_progress':
+                project['quarters_remaining'] -= 1
+
+                if project['quarters_remaining'] <= 0:
+                    # Complete the project
+                    if project['type'] == 'sector_development':
+                        self._complete_sector_project(project)
+                    elif project['type'] == 'infrastructure':
+                        self._complete_infrastructure_project(project)
+
+                    project['status'] = 'completed'
+                    completed.append(project)
+                    continue
+            elif status == 'completed':
                 continue
 
-            project['quarters_remaining'] -= 1
-
-            if project['quarters_remaining'] <= 0:
-                # Complete the project
-                if project['type'] == 'sector_development':
-                    self._complete_sector_project(project)
-                elif project['type'] == 'infrastructure':
-                    self._complete_infrastructure_project(project)
-
-                project['status'] = 'completed'
-                completed.append(project)
+            projects[keep] = project
+            keep += 1
 
-        # Remove completed projects from active list
-        self.data['active_projects'] = [
-            p for p in projects if p.get('status') != 'completed'
-        ]
+        del projects[keep:]
 
         return completed
 
@@ -346,11 +402,10 @@ class SectorEngine:
         infrastructure = self.data.get('infrastructure', {})
 
         for path, value in effects.items():
-            self._apply_nested_value(infrastructure, path, value)
+            self._apply_nested_value(infrastructure, _effect_keys(path), value)
 
-    def _apply_nested_value(self, data: dict, path: str, value) -> None:
-        """Apply a value to a nested dictionary path."""
-        keys = path.split('.')
+    def _apply_nested_value(self, data: dict, keys: Tuple[str, ...], value: Any) -> None:
+        """Apply a value to a nested dictionary path given as pre-split keys."""
         current = data
 
         for key in keys[:-1]:
@@ -368,15 +423,13 @@ class SectorEngine:
 
     def _deduct_budget(self, amount: float) -> None:
         """Deduct amount from development budget."""
-        budget = self.data.get('budget', {})
-        allocation = budget.get('allocation', {})
+        budget = self._budget
 
         # Try infrastructure budget first
-        if 'infrastructure' in allocation:
-            infra = allocation['infrastructure']
-            if infra.get('amount', 0) >= amount:
-                infra['amount'] -= amount
-                return
+        infra = budget['allocation'].get('infrastructure')
+        if infra is not None and infra.get('amount', 0) >= amount:
+            infra['amount'] -= amount
+            return
 
         # Fallback to general expenditure increase
         budget['total_expenditure_billions'] = (
@@ -400,19 +453,30 @@ class SectorEngine:
                 'requirements': self.SECTOR_REQUIREMENTS.get(sector_name, {})
             }
 
+        get = dict.get
         return {
             name: {
-                'level': s.get('level', 50),
-                'gdp_contribution': s.get('gdp_contribution_billions', 0),
-                'employment': s.get('employment', 0)
+                'level': get(s, 'level', 50),
+                'gdp_contribution': get(s, 'gdp_contribution_billions', 0),
+                'employment': get(s, 'employment', 0)
             }
             for name, s in sectors.items()
         }
 
     def get_active_projects(self) -> List[Dict]:
         """Get list of active projects."""
+        return self.describe_projects(self._projects)
+
+    @staticmethod
+    def describe_projects(active_projects: List[Dict]) -> List[Dict]:
+        """
+        Build the project listing from a country's active_projects.
+
+        Doesn't need an engine, so read-only callers can use it on shared
+        country data without SectorEngine filling in defaults.
+        """
         projects = []
-        for p in self.data.get('active_projects', []):
+        for p in active_projects:
             duration = max(1, p.get('duration_quarters', 1))
             remaining = p.get('quarters_remaining', 0)
             progress = int((1 - remaining / duration) * 100)
@@ -437,15 +501,13 @@ class SectorEngine:
 
         No refund is given.
         """
-        projects = self.data.get('active_projects', [])
+        projects = self._projects
 
         for i, project in enumerate(projects):
             if project.get('id') == project_id:
                 if project.get('status') == 'in_progress':
                     project['status'] = 'cancelled'
-                    self.data['active_projects'] = [
-                        p for p in projects if p.get('id') != project_id
-                    ]
+                    del projects[i]
                     return {
                         'success': True,
                         'cancelled_project': project,
@@ -458,3 +520,30 @@ class SectorEngine:
                     }
 
         return {'success': False, 'error': f'Project not found: {project_id}'}
+
+
+# Definitions built once from the class catalogs (which stay the public/JSON form)
+_SECTOR_DEFS: Dict[str, SectorDef] = {
+    name: SectorDef(
+        workforce=req.get('workforce', {}),
+        infrastructure=req.get('infrastructure', {}),
+        cost_per_level=req.get('cost_per_level', 0.5)
+    )
+    for name, req in SectorEngine.SECTOR_REQUIREMENTS.items()
+}
+
+_INFRA_DEFS: Dict[str, InfraDef] = {
+    name: InfraDef(
+        cost=project_def['cost'],
+        duration_quarters=project_def['duration_quarters'],
+        effects=project_def['effects'],
+        default_name=name.replace('_', ' ').title()
+    )
+    for name, project_def in SectorEngine.INFRASTRUCTURE_PROJECTS.items()
+}
+
+_EFFECT_KEYS.update(
+    (path, tuple(path.split('.')))
+    for project_def in SectorEngine.INFRASTRUCTURE_PROJECTS.values()
+    for path in project_def['effects']
+)
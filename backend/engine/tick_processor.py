@@ -4,6 +4,7 @@ Tick Processor - Phase 1
 Processes game ticks and coordinates updates across all game systems.
 """
 
+import asyncio
 from datetime import date
 from typing import TYPE_CHECKING, Dict, List, Optional
 
@@ -17,11 +18,16 @@ if TYPE_CHECKING:
     from backend.engine.event_engine import EventEngine
 
 
+# Tick types whose steps need engines built over the loaded country data
+_ENGINE_TICKS = frozenset({TickType.MONTHLY, TickType.QUARTERLY, TickType.YEARLY})
+
+
 class TickProcessor:
     """
     Coordinates tick updates across all game engines.
 
-    Registers handlers with ClockService and delegates to appropriate engines.
+    Registers a batch handler with ClockService and delegates to appropriate
+    engines, loading and saving country data once per game day.
     """
 
     def __init__(self, country_code: str, db_service):
@@ -39,12 +45,8 @@ class TickProcessor:
         self._register_handlers()
 
     def _register_handlers(self) -> None:
-        """Register tick handlers with clock service."""
-        clock_service.register_handler(TickType.DAILY, self.on_daily)
-        clock_service.register_handler(TickType.WEEKLY, self.on_weekly)
-        clock_service.register_handler(TickType.MONTHLY, self.on_monthly)
-        clock_service.register_handler(TickType.QUARTERLY, self.on_quarterly)
-        clock_service.register_handler(TickType.YEARLY, self.on_yearly)
+        """Register the batched tick handler with clock service."""
+        clock_service.register_batch_handler(self.on_tick_batch)
 
     def _init_engines(self, data: dict) -> None:
         """Initialize engines with current country data."""
@@ -58,20 +60,57 @@ class TickProcessor:
         self._demographics_engine = DemographicsEngine(data)
         self._sector_engine = SectorEngine(data)
 
-        # Load catalogs for engines that need them
-        weapons_catalog = self.db_service.load_weapons_catalog()
-        events_catalog = self.db_service.load_events_catalog()
+        # Catalogs are static; the shared weapons catalog lets ProcurementEngine
+        # reuse its flattened views instead of rebuilding them every tick
+        weapons_catalog = self.db_service.read_weapons_catalog()
+        events_catalog = self.db_service.read_events_catalog()
 
         self._procurement_engine = ProcurementEngine(data, weapons_catalog)
         self._event_engine = EventEngine(data, events_catalog)
 
         self._engines_initialized = True
 
+    async def on_tick_batch(self, game_date: date, day_count: int, tick_types: List[str]) -> None:
+        """
+        Run every tick type that fired on a game day under one load/save.
+
+        On a year boundary daily, monthly, quarterly and yearly all fire
+        together; the country file is read and written once for all of them.
+        """
+        # File I/O runs in worker threads so ticks don't stall the event loop;
+        # the country lock keeps endpoint writes out until the tick has saved
+        async with self.db_service.country_lock(self.country_code):
+            data = await asyncio.to_thread(self.db_service.load_country, self.country_code)
+
+            # Date-only days just update meta; no engine needs building
+            if not _ENGINE_TICKS.isdisjoint(tick_types):
+                await asyncio.to_thread(self._init_engines, data)
+
+            for tick_type in tick_types:
+                step = self._TICK_STEPS.get(tick_type)
+                if step:
+                    await step(self, data, game_date, day_count)
+
+            await asyncio.to_thread(self.db_service.save_country, self.country_code, data)
+
     async def on_daily(self, game_date: date, day_count: int) -> None:
         """Daily updates - sync game date to data."""
-        data = self.db_service.load_country(self.country_code)
+        await self.on_tick_batch(game_date, day_count, [TickType.DAILY])
 
-        # Update meta with current date
+    async def on_monthly(self, game_date: date, day_count: int) -> None:
+        """Monthly economic updates."""
+        await self.on_tick_batch(game_date, day_count, [TickType.MONTHLY])
+
+    async def on_quarterly(self, game_date: date, day_count: int) -> None:
+        """Quarterly sector/project updates."""
+        await self.on_tick_batch(game_date, day_count, [TickType.QUARTERLY])
+
+    async def on_yearly(self, game_date: date, day_count: int) -> None:
+        """Yearly demographic/political updates."""
+        await self.on_tick_batch(game_date, day_count, [TickType.YEARLY])
+
+    async def _process_daily(self, data: dict, game_date: date, day_count: int) -> None:
+        """Sync game date to data."""
         data['meta']['current_date'] = {
             'year': game_date.year,
             'month': game_date.month,
@@ -79,18 +118,8 @@ class TickProcessor:
         }
         data['meta']['total_game_days_elapsed'] = day_count
 
-        self.db_service.save_country(self.country_code, data)
-
-    async def on_weekly(self, game_date: date, day_count: int) -> None:
-        """Weekly updates - minor adjustments."""
-        # Currently minimal - could add weekly events or minor stat adjustments
-        pass
-
-    async def on_monthly(self, game_date: date, day_count: int) -> None:
-        """Monthly economic updates."""
-        data = self.db_service.load_country(self.country_code)
-        self._init_engines(data)
-
+    async def _process_monthly(self, data: dict, game_date: date, day_count: int) -> None:
+        """Economic tick and event checks."""
         # Process economic tick
         if self._economy_engine:
             changes = self._economy_engine.process_monthly_tick()
@@ -114,14 +143,8 @@ class TickProcessor:
             # Process existing events (decrement duration)
             self._event_engine.process_active_events()
 
-        self.db_service.save_country(self.country_code, data)
-
-    async def on_quarterly(self, game_date: date, day_count: int) -> None:
-        """Quarterly sector/project updates."""
-        data = self.db_service.load_country(self.country_code)
-        self._init_engines(data)
-
-        # Process sector development projects
+    async def _process_quarterly(self, data: dict, game_date: date, day_count: int) -> None:
+        """Sector development project progress."""
         if self._sector_engine:
             completed = self._sector_engine.process_quarterly_progress()
             if completed:
@@ -129,30 +152,32 @@ class TickProcessor:
                     data['completed_projects'] = []
                 data['completed_projects'].extend(completed)
 
-        self.db_service.save_country(self.country_code, data)
-
-    async def on_yearly(self, game_date: date, day_count: int) -> None:
-        """Yearly demographic/political updates."""
-        data = self.db_service.load_country(self.country_code)
-        self._init_engines(data)
-
-        # Process demographics
-        if self._demographics_engine:
-            changes = self._demographics_engine.process_yearly_tick()
-            data['meta']['last_demographic_update'] = {
-                'date': {'year': game_date.year, 'month': game_date.month, 'day': game_date.day},
-                'changes': changes
-            }
+    async def _process_yearly(self, data: dict, game_date: date, day_count: int) -> None:
+        """Demographics and weapon deliveries."""
+        # Demographics (demographics/workforce/indices) and deliveries
+        # (military_inventory/active_projects) touch disjoint subtrees, so
+        # they run concurrently. Deliveries share active_projects with the
+        # quarterly sector step, which always completes before this one.
+        demographic_changes, deliveries = await asyncio.gather(
+            asyncio.to_thread(self._demographics_engine.process_yearly_tick),
+            asyncio.to_thread(self._procurement_engine.process_deliveries, game_date.year)
+        )
+
+        data['meta']['last_demographic_update'] = {
+            'date': {'year': game_date.year, 'month': game_date.month, 'day': game_date.day},
+            'changes': demographic_changes
+        }
 
-        # Process weapon deliveries
-        if self._procurement_engine:
-            deliveries = self._procurement_engine.process_deliveries(game_date.year)
-            if deliveries:
-                if 'recent_deliveries' not in data:
-                    data['recent_deliveries'] = []
-                data['recent_deliveries'] = deliveries  # Keep only most recent
+        if deliveries:
+            data['recent_deliveries'] = deliveries  # Keep only most recent
 
-        self.db_service.save_country(self.country_code, data)
+    # Tick types without work (currently weekly) have no step and cost nothing
+    _TICK_STEPS = {
+        TickType.DAILY: _process_daily,
+        TickType.MONTHLY: _process_monthly,
+        TickType.QUARTERLY: _process_quarterly,
+        TickType.YEARLY: _process_yearly,
+    }
 
     def get_status(self) -> Dict:
         """Get tick processor status."""
@@ -169,9 +194,10 @@ _processors: Dict[str, TickProcessor] = {}
 
 def get_processor(country_code: str, db_service) -> TickProcessor:
     """Get or create a tick processor for a country."""
-    if country_code not in _processors:
-        _processors[country_code] = TickProcessor(country_code, db_service)
-    return _processors[country_code]
+    processor = _processors.get(country_code)
+    if processor is None:
+        processor = _processors[country_code] = TickProcessor(country_code, db_service)
+    return processor
 
 
 def remove_processor(country_code: str) -> None:
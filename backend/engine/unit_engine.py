@@ -23,6 +23,13 @@ class MovementResult(Enum):
     INSUFFICIENT_FUEL = "insufficient_fuel"
 
 
+# Statuses of units travelling under a UnitMovement
+_MOVING_STATUSES = frozenset({UnitStatus.IN_TRANSIT, UnitStatus.RETURNING})
+
+# Statuses that contribute no combat strength
+_INACTIVE_STATUSES = frozenset({UnitStatus.DESTROYED, UnitStatus.MAINTENANCE})
+
+
 class UnitEngine:
     """Engine for managing military unit operations."""
 
@@ -50,21 +57,38 @@ class UnitEngine:
 
     def __init__(self, country_code: str):
         self.country_code = country_code.upper()
+        # Moving unit id -> ETA as epoch seconds, so ticks skip the idle roster
+        # and compare plain floats instead of datetimes
+        self._moving: Dict[str, float] = {}
+        self._moving_source: Optional[UnitList] = None
+
+    def _moving_index(self, unit_list: UnitList) -> Dict[str, float]:
+        """Get the moving-unit index, rebuilding it whenever the roster is reloaded."""
+        if unit_list is not self._moving_source:
+            self._moving = {
+                u.id: u.movement.eta.timestamp() for u in unit_list.units
+                if u.movement is not None and u.status in _MOVING_STATUSES
+            }
+            self._moving_source = unit_list
+        return self._moving
 
     def _get_unit_speed(self, unit: MilitaryUnit) -> float:
         """Get unit speed in km/h."""
-        if unit.speed_kmh and unit.speed_kmh > 0:
-            return unit.speed_kmh
+        speed = unit.speed_kmh
+        if speed and speed > 0:
+            return speed
         return self.DEFAULT_SPEEDS.get(unit.category, 50)
 
-    def _calculate_travel_time(self, unit: MilitaryUnit, distance_km: float) -> timedelta:
-        """Calculate travel time for a unit to cover a distance."""
-        speed = self._get_unit_speed(unit)
+    @staticmethod
+    def _travel_hours(speed: float, distance_km: float) -> float:
+        """Hours needed to cover a distance at a given speed."""
         if speed <= 0:
-            return timedelta(hours=9999)  # Effectively infinite for stationary units
+            return 9999  # Effectively infinite for stationary units
+        return distance_km / speed
 
-        hours = distance_km / speed
-        return timedelta(hours=hours)
+    def _calculate_travel_time(self, unit: MilitaryUnit, distance_km: float) -> timedelta:
+        """Calculate travel time for a unit to cover a distance."""
+        return timedelta(hours=self._travel_hours(self._get_unit_speed(unit), distance_km))
 
     def _calculate_fuel_consumption(self, unit: MilitaryUnit, travel_hours: float) -> float:
         """Calculate fuel consumed for travel (percent of tank)."""
@@ -111,35 +135,26 @@ class UnitEngine:
 
         return True, "OK"
 
-    def deploy_unit(
+    def _check_deployment(
         self,
-        unit_id: str,
-        destination: Coordinates,
-        instant: bool = False
+        unit: MilitaryUnit,
+        destination: Coordinates
     ) -> Tuple[MovementResult, Dict[str, Any]]:
         """
-        Deploy a unit to a new location.
-
-        Args:
-            unit_id: The unit to deploy
-            destination: Target coordinates
-            instant: If True, move instantly (for testing/debug)
+        Check whether a unit can travel to a destination, cheapest checks first.
 
         Returns:
-            Tuple of (result_code, details_dict)
+            Tuple of (result_code, details). On success details holds the
+            distance_km, speed, travel_hours and fuel_needed for the trip.
         """
-        unit = self.get_unit(unit_id)
-        if not unit:
-            return MovementResult.UNIT_NOT_FOUND, {"error": "Unit not found"}
-
         can_move, reason = self.can_unit_move(unit)
         if not can_move:
             return MovementResult.UNIT_CANNOT_MOVE, {"error": reason}
 
         # Calculate distance and travel time
         distance_km = unit.location.distance_to(destination)
-        travel_time = self._calculate_travel_time(unit, distance_km)
-        travel_hours = travel_time.total_seconds() / 3600
+        speed = self._get_unit_speed(unit)
+        travel_hours = self._travel_hours(speed, distance_km)
 
         # Check fuel
         fuel_needed = self._calculate_fuel_consumption(unit, travel_hours)
@@ -158,6 +173,58 @@ class UnitEngine:
                 "max_range_km": unit.combat_radius_km * 2
             }
 
+        return MovementResult.SUCCESS, {
+            "distance_km": distance_km,
+            "speed": speed,
+            "travel_hours": travel_hours,
+            "fuel_needed": fuel_needed
+        }
+
+    def deploy_unit(
+        self,
+        unit_id: str,
+        destination: Coordinates,
+        instant: bool = False
+    ) -> Tuple[MovementResult, Dict[str, Any]]:
+        """
+        Deploy a unit to a new location.
+
+        Args:
+            unit_id: The unit to deploy
+            destination: Target coordinates
+            instant: If True, move instantly (for testing/debug)
+
+        Returns:
+            Tuple of (result_code, details_dict)
+        """
+        unit = self.get_unit(unit_id)
+        if not unit:
+            return MovementResult.UNIT_NOT_FOUND, {"error": "Unit not found"}
+
+        return self._deploy_unit_on(unit, destination, instant)
+
+    def _deploy_unit_on(
+        self,
+        unit: MilitaryUnit,
+        destination: Coordinates,
+        instant: bool = False,
+        save: bool = True
+    ) -> Tuple[MovementResult, Dict[str, Any]]:
+        """
+        Deploy an already fetched unit (see deploy_unit).
+
+        With save=False the caller is expected to make further changes to
+        the unit and write it once itself.
+        """
+        result, plan = self._check_deployment(unit, destination)
+        if result != MovementResult.SUCCESS:
+            return result, plan
+
+        distance_km = plan["distance_km"]
+        speed = plan["speed"]
+        travel_hours = plan["travel_hours"]
+        fuel_needed = plan["fuel_needed"]
+
         now = datetime.utcnow()
 
         if instant:
@@ -173,16 +240,23 @@ class UnitEngine:
                 origin=unit.location,
                 destination=destination,
                 started_at=now,
-                eta=now + travel_time,
-                speed_kmh=self._get_unit_speed(unit)
+                eta=now + timedelta(hours=travel_hours),
+                speed_kmh=speed
             )
             unit.status = UnitStatus.IN_TRANSIT
             unit.current_base_id = None
 
-        map_service.update_unit(self.country_code, unit)
+        if save:
+            map_service.update_unit(self.country_code, unit)
+
+        moving = self._moving_index(self.get_all_units())
+        if unit.movement is not None:
+            moving[unit.id] = unit.movement.eta.timestamp()
+        else:
+            moving.pop(unit.id, None)
 
         return MovementResult.SUCCESS, {
-            "unit_id": unit_id,
+            "unit_id": unit.id,
             "destination": {"lat": destination.lat, "lng": destination.lng},
             "distance_km": distance_km,
             "travel_time_hours": travel_hours,
@@ -209,11 +283,10 @@ class UnitEngine:
         if not base:
             return MovementResult.BASE_NOT_FOUND, {"error": "Home base not found"}
 
-        result, details = self.deploy_unit(unit_id, base.location, instant)
+        result, details = self._deploy_unit_on(unit, base.location, instant, save=False)
 
         if result == MovementResult.SUCCESS:
             # Update unit to mark it as returning to base
-            unit = self.get_unit(unit_id)
             if instant:
                 unit.status = UnitStatus.IDLE
                 unit.current_base_id = unit.home_base_id
@@ -251,15 +324,12 @@ class UnitEngine:
         if not base:
             return MovementResult.BASE_NOT_FOUND, {"error": "Target base not found"}
 
-        # Check base capacity (simplified)
-        units_at_base = map_service.load_units(self.country_code).get_at_base(target_base_id)
-        # For now, allow transfers without capacity check
-        # In production, would check base.capabilities vs current usage
+        # Transfers are not capacity-checked yet; when they are, compare
+        # base.capabilities against the units stationed there
 
-        result, details = self.deploy_unit(unit_id, base.location, instant)
+        result, details = self._deploy_unit_on(unit, base.location, instant, save=False)
 
         if result == MovementResult.SUCCESS:
-            unit = self.get_unit(unit_id)
             if instant:
                 unit.status = UnitStatus.IDLE
                 unit.current_base_id = target_base_id
@@ -279,58 +349,61 @@ class UnitEngine:
         """
         completed = []
         unit_list = self.get_all_units()
+        moving = self._moving_index(unit_list)
+        now_ts = current_time.timestamp()
+
+        # Only units whose indexed ETA has passed are looked at. Anything that
+        # stopped moving some other way (destroyed, reset by an endpoint)
+        # drops out then; a changed movement is re-indexed.
+        arrived = []
+        for unit_id in [uid for uid, eta_ts in moving.items() if now_ts >= eta_ts]:
+            unit = unit_list.get_by_id(unit_id)
+            if unit is None or unit.movement is None or unit.status not in _MOVING_STATUSES:
+                del moving[unit_id]
+            elif current_time < unit.movement.eta:
+                moving[unit_id] = unit.movement.eta.timestamp()
+            else:
+                del moving[unit_id]
+                arrived.append(unit)
 
-        for unit in unit_list.units:
-            if unit.status != UnitStatus.IN_TRANSIT or not unit.movement:
-                continue
-
-            if current_time >= unit.movement.eta:
-                # Movement complete
-                travel_hours = (unit.movement.eta - unit.movement.started_at).total_seconds() / 3600
-                fuel_consumed = self._calculate_fuel_consumption(unit, travel_hours)
+        for unit in arrived:
+            movement = unit.movement
+            travel_hours = (movement.eta - movement.started_at).total_seconds() / 3600
+            fuel_consumed = self._calculate_fuel_consumption(unit, travel_hours)
 
-                unit.location = unit.movement.destination
-                unit.fuel_percent = max(0, unit.fuel_percent - fuel_consumed)
-                unit.movement = None
+            unit.location = movement.destination
+            unit.fuel_percent = max(0, unit.fuel_percent - fuel_consumed)
+            unit.movement = None
 
-                # Determine final status
-                if unit.status == UnitStatus.RETURNING:
-                    unit.status = UnitStatus.IDLE
-                    unit.current_base_id = unit.home_base_id
-                    unit.assigned_operation_id = None
-                else:
-                    unit.status = UnitStatus.DEPLOYED
+            # Determine final status
+            if unit.status == UnitStatus.RETURNING:
+                unit.status = UnitStatus.IDLE
+                unit.current_base_id = unit.home_base_id
+                unit.assigned_operation_id = None
+            else:
+                unit.status = UnitStatus.DEPLOYED
 
-                map_service.update_unit(self.country_code, unit)
+            completed.append({
+                "unit_id": unit.id,
+                "location": unit.location.model_dump(),
+                "status": unit.status.value
+            })
 
-                completed.append({
-                    "unit_id": unit.id,
-                    "location": unit.location.model_dump(),
-                    "status": unit.status.value
-                })
+        map_service.update_units_bulk(self.country_code, arrived)
 
         return completed
 
-    def update_unit_status(
+    def _apply_status_update(
         self,
-        unit_id: str,
+        unit: MilitaryUnit,
         status: Optional[UnitStatus] = None,
         health_delta: float = 0,
         fuel_delta: float = 0,
         ammo_delta: float = 0,
         morale_delta: int = 0,
         experience_delta: int = 0
-    ) -> Tuple[bool, Dict[str, Any]]:
-        """
-        Update unit stats (for combat results, resupply, etc.).
-
-        Returns:
-            Tuple of (success, updated_stats)
-        """
-        unit = self.get_unit(unit_id)
-        if not unit:
-            return False, {"error": "Unit not found"}
-
+    ) -> Dict[str, Any]:
+        """Apply clamped stat deltas to a unit in memory and return its new stats."""
         if status:
             unit.status = status
 
@@ -344,10 +417,8 @@ class UnitEngine:
         if unit.health_percent <= 0:
             unit.status = UnitStatus.DESTROYED
 
-        map_service.update_unit(self.country_code, unit)
-
-        return True, {
-            "unit_id": unit_id,
+        return {
+            "unit_id": unit.id,
             "status": unit.status.value,
             "health": unit.health_percent,
             "fuel": unit.fuel_percent,
@@ -356,6 +427,59 @@ class UnitEngine:
             "experience": unit.experience_level
         }
 
+    def update_unit_status(
+        self,
+        unit_id: str,
+        status: Optional[UnitStatus] = None,
+        health_delta: float = 0,
+        fuel_delta: float = 0,
+        ammo_delta: float = 0,
+        morale_delta: int = 0,
+        experience_delta: int = 0
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Update unit stats (for combat results, resupply, etc.).
+
+        Returns:
+            Tuple of (success, updated_stats)
+        """
+        unit = self.get_unit(unit_id)
+        if not unit:
+            return False, {"error": "Unit not found"}
+
+        stats = self._apply_status_update(
+            unit, status, health_delta, fuel_delta, ammo_delta, morale_delta, experience_delta
+        )
+        map_service.update_unit(self.country_code, unit)
+
+        return True, stats
+
+    def update_unit_status_bulk(self, updates: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Update stats for several units and save them together.
+
+        Args:
+            updates: unit_id -> keyword arguments accepted by update_unit_status
+                (status, health_delta, fuel_delta, ...)
+
+        Returns:
+            unit_id -> updated stats, for the units that were found
+        """
+        unit_list = self.get_all_units()
+        results = {}
+        changed = []
+
+        for unit_id, deltas in updates.items():
+            unit = unit_list.get_by_id(unit_id)
+            if not unit:
+                continue
+            results[unit_id] = self._apply_status_update(unit, **deltas)
+            changed.append(unit)
+
+        map_service.update_units_bulk(self.country_code, changed)
+
+        return results
+
     def resupply_unit(self, unit_id: str) -> Tuple[bool, Dict[str, Any]]:
         """
         Fully resupply a unit (fuel, ammo). Unit must be at a base.
@@ -422,7 +546,9 @@ class UnitEngine:
         by_category = {}
         by_status = {}
         total_strength = 0
+        available = 0
 
+        # Single pass over the roster for every aggregate
         for unit in unit_list.units:
             cat = unit.category.value
             by_category[cat] = by_category.get(cat, 0) + unit.quantity
@@ -430,13 +556,28 @@ class UnitEngine:
             status = unit.status.value
             by_status[status] = by_status.get(status, 0) + 1
 
-            if unit.status not in [UnitStatus.DESTROYED, UnitStatus.MAINTENANCE]:
+            if unit.status not in _INACTIVE_STATUSES:
                 total_strength += unit.get_effective_strength() * unit.quantity
+            if unit.can_deploy():
+                available += 1
 
         return {
             "total_units": len(unit_list.units),
             "by_category": by_category,
             "by_status": by_status,
-            "available_for_deployment": len(unit_list.get_available()),
+            "available_for_deployment": available,
             "total_effective_strength": round(total_strength, 2)
         }
+
+
+# Per-country engines, shared so any state they cache survives across requests
+_engines: Dict[str, UnitEngine] = {}
+
+
+def get_unit_engine(country_code: str) -> UnitEngine:
+    """Get or create the unit engine for a country."""
+    country_code = country_code.upper()
+    engine = _engines.get(country_code)
+    if engine is None:
+        engine = _engines[country_code] = UnitEngine(country_code)
+    return engine
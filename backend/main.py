@@ -5,18 +5,21 @@ FastAPI application with game engine integration.
 """
 
 import asyncio
+import hashlib
+import json
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request, Response, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from backend.config import config
-from backend.services.db_service import db_service
+from backend.services.db_service import db_service, country_write
 from backend.services.save_service import save_service
+from backend.services.map_service import map_service
 
 # Engine imports
 from backend.engine.clock_service import clock_service, TickType
@@ -93,6 +96,31 @@ class SaveGame(BaseModel):
     description: Optional[str] = None
 
 
+# =============================================================================
+# Country Dependencies
+# =============================================================================
+
+async def read_country_entry(country_code: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Shared, read-only country state and its version (see read_country_versioned).
+
+    Cache hits are served on the event loop; a miss (first read, or the
+    first after a save) parses the file in a worker thread.
+    """
+    entry = db_service.peek_country_versioned(country_code)
+    if entry is None:
+        entry = await asyncio.to_thread(db_service.read_country_versioned, country_code)
+    return entry
+
+
+async def read_country_data(country_code: str) -> Dict[str, Any]:
+    """Shared, read-only country state for GET endpoints (see read_country_entry)."""
+    try:
+        return (await read_country_entry(country_code))[1]
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+
+
 # =============================================================================
 # Application Lifespan
 # =============================================================================
@@ -108,6 +136,14 @@ async def lifespan(app: FastAPI):
     country_code = state.get("selected_country", "ISR")
     get_processor(country_code, db_service)
 
+    # Warm the caches the first requests will hit
+    try:
+        db_service.read_country(country_code)
+    except FileNotFoundError:
+        pass
+    map_service.load_units(country_code)
+    map_service.load_bases(country_code)
+
     # Start clock service
     clock_service.start()
     print(f"Game clock started for {country_code}")
@@ -175,83 +211,67 @@ async def list_countries():
 
 
 @app.get("/api/country/{country_code}")
-async def get_country(country_code: str):
-    """Get full country state."""
+async def get_country(country_code: str, request: Request, response: Response):
+    """Get full country state. Supports If-None-Match with the returned ETag."""
     try:
-        data = db_service.load_country(country_code.upper())
+        version, data = await read_country_entry(country_code.upper())
+        etag = f'"{version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         return data
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
 
 
 @app.get("/api/country/{country_code}/economy")
-async def get_economy(country_code: str):
+async def get_economy(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get economy and budget data with summary."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        engine = EconomyEngine(data)
-        return {
-            "economy": data.get("economy", {}),
-            "budget": data.get("budget", {}),
-            "summary": engine.get_economic_summary()
-        }
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    engine = EconomyEngine(data)
+    return {
+        "economy": data.get("economy", {}),
+        "budget": data.get("budget", {}),
+        "summary": engine.get_economic_summary()
+    }
 
 
 @app.get("/api/country/{country_code}/military")
-async def get_military(country_code: str):
+async def get_military(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get military data with summary."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        engine = OperationsEngine(data)
-        return {
-            "military": data.get("military", {}),
-            "inventory": data.get("military_inventory", {}),
-            "summary": engine.get_military_summary()
-        }
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    engine = OperationsEngine(data)
+    return {
+        "military": data.get("military", {}),
+        "inventory": data.get("military_inventory", {}),
+        "summary": engine.get_military_summary()
+    }
 
 
 @app.get("/api/country/{country_code}/demographics")
-async def get_demographics(country_code: str):
+async def get_demographics(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get demographics and workforce data with summary."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        engine = DemographicsEngine(data)
-        return {
-            "demographics": data.get("demographics", {}),
-            "workforce": data.get("workforce", {}),
-            "summary": engine.get_demographic_summary(),
-            "workforce_summary": engine.get_workforce_summary()
-        }
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    engine = DemographicsEngine(data)
+    return {
+        "demographics": data.get("demographics", {}),
+        "workforce": data.get("workforce", {}),
+        "summary": engine.get_demographic_summary(),
+        "workforce_summary": engine.get_workforce_summary()
+    }
 
 
 @app.get("/api/country/{country_code}/infrastructure")
-async def get_infrastructure(country_code: str):
+async def get_infrastructure(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get infrastructure data."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        return {
-            "infrastructure": data.get("infrastructure", {})
-        }
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    return {
+        "infrastructure": data.get("infrastructure", {})
+    }
 
 
 @app.get("/api/country/{country_code}/relations")
-async def get_relations(country_code: str):
+async def get_relations(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get diplomatic relations data."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        return {
-            "relations": data.get("relations", {})
-        }
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    return {
+        "relations": data.get("relations", {})
+    }
 
 
 @app.get("/api/country/{country_code}/sectors")
@@ -343,26 +363,23 @@ async def set_speed(speed: int = Query(..., description="Game speed (1, 2, 5, or
 @app.get("/api/game/stream")
 async def stream_updates():
     """SSE endpoint for real-time game updates."""
-    import json
-
     async def event_generator():
         last_day = clock_service.day_count
         while True:
-            if clock_service.day_count > last_day:
-                last_day = clock_service.day_count
-                state = db_service.load_game_state()
-                country_code = state.get("selected_country", "ISR")
-                try:
-                    data = db_service.load_country(country_code)
-                    update = {
-                        "clock": clock_service.get_state(),
-                        "meta": data.get("meta", {}),
-                        "indices": data.get("indices", {})
-                    }
-                    yield f"data: {json.dumps(update)}\n\n"
-                except Exception:
-                    pass
-            await asyncio.sleep(0.5)
+            # Sleeps until the clock finishes a day; idle or paused games cost nothing
+            last_day = await clock_service.wait_for_day(last_day)
+            state = db_service.load_game_state()
+            country_code = state.get("selected_country", "ISR")
+            try:
+                data = (await read_country_entry(country_code))[1]
+                update = {
+                    "clock": clock_service.get_state(),
+                    "meta": data.get("meta", {}),
+                    "indices": data.get("indices", {})
+                }
+                yield f"data: {json.dumps(update, separators=(',', ':'))}\n\n"
+            except Exception:
+                pass
 
     return StreamingResponse(
         event_generator(),
@@ -375,17 +392,14 @@ async def stream_updates():
 # =============================================================================
 
 @app.get("/api/budget/{country_code}")
-async def get_budget(country_code: str):
+async def get_budget(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get budget summary."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        engine = BudgetEngine(data)
-        return engine.get_budget_summary()
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    engine = BudgetEngine(data)
+    return engine.get_budget_summary()
 
 
 @app.post("/api/budget/{country_code}/adjust")
+@country_write
 async def adjust_budget(country_code: str, adjustment: BudgetAdjustment):
     """Adjust budget allocation."""
     try:
@@ -399,7 +413,7 @@ async def adjust_budget(country_code: str, adjustment: BudgetAdjustment):
         )
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -407,6 +421,7 @@ async def adjust_budget(country_code: str, adjustment: BudgetAdjustment):
 
 
 @app.post("/api/budget/{country_code}/tax")
+@country_write
 async def set_tax_rate(country_code: str, adjustment: TaxAdjustment):
     """Set tax rate."""
     try:
@@ -416,7 +431,7 @@ async def set_tax_rate(country_code: str, adjustment: TaxAdjustment):
         result = engine.set_tax_rate(adjustment.new_rate)
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -424,6 +439,7 @@ async def set_tax_rate(country_code: str, adjustment: TaxAdjustment):
 
 
 @app.post("/api/budget/{country_code}/debt/take")
+@country_write
 async def take_debt(country_code: str, action: DebtAction):
     """Take on debt."""
     try:
@@ -433,7 +449,7 @@ async def take_debt(country_code: str, action: DebtAction):
         result = engine.take_debt(action.amount_billions)
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -441,6 +457,7 @@ async def take_debt(country_code: str, action: DebtAction):
 
 
 @app.post("/api/budget/{country_code}/debt/repay")
+@country_write
 async def repay_debt(country_code: str, action: DebtAction):
     """Repay debt."""
     try:
@@ -450,7 +467,7 @@ async def repay_debt(country_code: str, action: DebtAction):
         result = engine.repay_debt(action.amount_billions)
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -462,6 +479,7 @@ async def repay_debt(country_code: str, action: DebtAction):
 # =============================================================================
 
 @app.post("/api/sectors/{country_code}/invest")
+@country_write
 async def invest_in_sector(country_code: str, investment: SectorInvestment):
     """Invest in a sector."""
     try:
@@ -475,7 +493,7 @@ async def invest_in_sector(country_code: str, investment: SectorInvestment):
         )
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -483,6 +501,7 @@ async def invest_in_sector(country_code: str, investment: SectorInvestment):
 
 
 @app.post("/api/sectors/{country_code}/infrastructure")
+@country_write
 async def start_infrastructure(country_code: str, project: InfrastructureProject):
     """Start an infrastructure project."""
     try:
@@ -495,7 +514,7 @@ async def start_infrastructure(country_code: str, project: InfrastructureProject
         )
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -503,17 +522,13 @@ async def start_infrastructure(country_code: str, project: InfrastructureProject
 
 
 @app.get("/api/sectors/{country_code}/projects")
-async def get_projects(country_code: str):
+async def get_projects(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get active projects."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        engine = SectorEngine(data)
-        return {"projects": engine.get_active_projects()}
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    return {"projects": SectorEngine.describe_projects(data.get('active_projects', []))}
 
 
 @app.delete("/api/sectors/{country_code}/projects/{project_id}")
+@country_write
 async def cancel_project(country_code: str, project_id: str):
     """Cancel a project."""
     try:
@@ -523,7 +538,7 @@ async def cancel_project(country_code: str, project_id: str):
         result = engine.cancel_project(project_id)
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -534,10 +549,24 @@ async def cancel_project(country_code: str, project_id: str):
 # Military Procurement API Endpoints
 # =============================================================================
 
+# Catalogs only change with their files; clients and proxies may reuse them
+# briefly and revalidate with If-None-Match after that
+_CATALOG_CACHE_CONTROL = "public, max-age=60"
+
+
 @app.get("/api/procurement/catalog")
-async def get_weapons_catalog(category: Optional[str] = None):
-    """Get weapons catalog with flattened weapon IDs."""
-    raw_catalog = db_service.load_weapons_catalog()
+async def get_weapons_catalog(request: Request, response: Response, category: Optional[str] = None):
+    """Get weapons catalog with flattened weapon IDs. Supports If-None-Match."""
+    try:
+        version, raw_catalog = db_service.read_catalog_versioned("weapons_catalog")
+    except FileNotFoundError:
+        version, raw_catalog = "none", {}
+
+    headers = {"ETag": f'"{version}"', "Cache-Control": _CATALOG_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+
     # Use ProcurementEngine to get properly flattened catalog
     engine = ProcurementEngine({}, raw_catalog)
     catalog = engine.get_catalog(category)
@@ -545,15 +574,11 @@ async def get_weapons_catalog(category: Optional[str] = None):
 
 
 @app.get("/api/procurement/{country_code}/orders")
-async def get_procurement_orders(country_code: str):
+async def get_procurement_orders(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get active procurement orders."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        catalog = db_service.load_weapons_catalog()
-        engine = ProcurementEngine(data, catalog)
-        return {"orders": engine.get_active_orders()}
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    catalog = db_service.read_weapons_catalog()
+    engine = ProcurementEngine(data, catalog)
+    return {"orders": engine.get_active_orders()}
 
 
 @app.post("/api/procurement/{country_code}/check")
@@ -561,7 +586,7 @@ async def check_purchase_eligibility(country_code: str, purchase: WeaponPurchase
     """Check if a weapon purchase is possible."""
     try:
         data = db_service.load_country(country_code.upper())
-        catalog = db_service.load_weapons_catalog()
+        catalog = db_service.read_weapons_catalog()
         engine = ProcurementEngine(data, catalog)
 
         return engine.check_purchase_eligibility(
@@ -573,11 +598,12 @@ async def check_purchase_eligibility(country_code: str, purchase: WeaponPurchase
 
 
 @app.post("/api/procurement/{country_code}/purchase")
+@country_write
 async def purchase_weapon(country_code: str, purchase: WeaponPurchase):
     """Purchase weapons."""
     try:
         data = db_service.load_country(country_code.upper())
-        catalog = db_service.load_weapons_catalog()
+        catalog = db_service.read_weapons_catalog()
         engine = ProcurementEngine(data, catalog)
 
         result = engine.request_purchase(
@@ -586,7 +612,7 @@ async def purchase_weapon(country_code: str, purchase: WeaponPurchase):
         )
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -594,11 +620,12 @@ async def purchase_weapon(country_code: str, purchase: WeaponPurchase):
 
 
 @app.post("/api/procurement/{country_code}/sell")
+@country_write
 async def sell_weapon(country_code: str, sale: WeaponSale):
     """Sell weapons from inventory."""
     try:
         data = db_service.load_country(country_code.upper())
-        catalog = db_service.load_weapons_catalog()
+        catalog = db_service.read_weapons_catalog()
         engine = ProcurementEngine(data, catalog)
 
         result = engine.sell_weapons(
@@ -608,7 +635,7 @@ async def sell_weapon(country_code: str, sale: WeaponSale):
         )
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -616,17 +643,18 @@ async def sell_weapon(country_code: str, sale: WeaponSale):
 
 
 @app.delete("/api/procurement/{country_code}/orders/{order_id}")
+@country_write
 async def cancel_order(country_code: str, order_id: str):
     """Cancel a procurement order."""
     try:
         data = db_service.load_country(country_code.upper())
-        catalog = db_service.load_weapons_catalog()
+        catalog = db_service.read_weapons_catalog()
         engine = ProcurementEngine(data, catalog)
 
         result = engine.cancel_order(order_id)
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -637,13 +665,27 @@ async def cancel_order(country_code: str, order_id: str):
 # Military Operations API Endpoints
 # =============================================================================
 
+# Static definitions, encoded once rather than per request
+_OPERATION_TYPES_JSON = json.dumps({
+    "types": [op.value for op in OperationType],
+    "details": {op.value: details for op, details in OperationsEngine.OPERATIONS.items()}
+}, separators=(",", ":")).encode()
+_OPERATION_TYPES_HEADERS = {
+    "ETag": f'"{hashlib.blake2b(_OPERATION_TYPES_JSON, digest_size=8).hexdigest()}"',
+    "Cache-Control": _CATALOG_CACHE_CONTROL
+}
+
+
 @app.get("/api/operations/types")
-async def get_operation_types():
-    """Get available operation types."""
-    return {
-        "types": [op.value for op in OperationType],
-        "details": OperationsEngine.OPERATIONS
-    }
+async def get_operation_types(request: Request):
+    """Get available operation types. Supports If-None-Match."""
+    if request.headers.get("if-none-match") == _OPERATION_TYPES_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_OPERATION_TYPES_HEADERS)
+    return Response(
+        content=_OPERATION_TYPES_JSON,
+        media_type="application/json",
+        headers=_OPERATION_TYPES_HEADERS
+    )
 
 
 @app.post("/api/operations/{country_code}/plan")
@@ -664,6 +706,7 @@ async def plan_operation(country_code: str, plan: OperationPlan):
 
 
 @app.post("/api/operations/{country_code}/execute")
+@country_write
 async def execute_operation(country_code: str, plan: OperationPlan):
     """Execute a military operation."""
     try:
@@ -677,7 +720,7 @@ async def execute_operation(country_code: str, plan: OperationPlan):
             plan.assets_committed
         )
 
-        db_service.save_country(country_code.upper(), data)
+        await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result.to_dict()
     except FileNotFoundError:
@@ -685,6 +728,7 @@ async def execute_operation(country_code: str, plan: OperationPlan):
 
 
 @app.post("/api/operations/{country_code}/readiness")
+@country_write
 async def set_readiness(country_code: str, level: str = Query(..., description="low, normal, high, or maximum")):
     """Set military readiness level."""
     try:
@@ -694,7 +738,7 @@ async def set_readiness(country_code: str, level: str = Query(..., description="
         result = engine.set_readiness_level(level)
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -706,33 +750,30 @@ async def set_readiness(country_code: str, level: str = Query(..., description="
 # =============================================================================
 
 @app.get("/api/events/{country_code}")
-async def get_events(country_code: str):
+async def get_events(country_code: str, data: Dict[str, Any] = Depends(read_country_data)):
     """Get active events."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        events_catalog = db_service.load_events_catalog()
-        engine = EventEngine(data, events_catalog)
+    events_catalog = db_service.read_events_catalog()
+    engine = EventEngine(data, events_catalog)
 
-        return {
-            "active_events": engine.get_active_events(),
-            "history": engine.get_event_history()
-        }
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    return {
+        "active_events": engine.get_active_events(),
+        "history": engine.get_event_history()
+    }
 
 
 @app.post("/api/events/{country_code}/respond")
+@country_write
 async def respond_to_event(country_code: str, response: EventResponse):
     """Respond to an active event."""
     try:
         data = db_service.load_country(country_code.upper())
-        events_catalog = db_service.load_events_catalog()
+        events_catalog = db_service.read_events_catalog()
         engine = EventEngine(data, events_catalog)
 
         result = engine.respond_to_event(response.event_id, response.response)
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -740,17 +781,18 @@ async def respond_to_event(country_code: str, response: EventResponse):
 
 
 @app.post("/api/events/{country_code}/trigger")
+@country_write
 async def trigger_event(country_code: str, event_id: str = Query(...)):
     """Force trigger an event (for testing)."""
     try:
         data = db_service.load_country(country_code.upper())
-        events_catalog = db_service.load_events_catalog()
+        events_catalog = db_service.read_events_catalog()
         engine = EventEngine(data, events_catalog)
 
         result = engine.force_event(event_id)
 
         if result.get('success'):
-            db_service.save_country(country_code.upper(), data)
+            await asyncio.to_thread(db_service.save_country, country_code.upper(), data)
 
         return result
     except FileNotFoundError:
@@ -819,20 +861,18 @@ async def quick_load():
 # =============================================================================
 
 @app.post("/api/constraints/{country_code}/check")
-async def check_constraints(country_code: str, constraints: dict):
+async def check_constraints(country_code: str, constraints: dict, data: Dict[str, Any] = Depends(read_country_data)):
     """Check if constraints are satisfied."""
-    try:
-        data = db_service.load_country(country_code.upper())
-        engine = ConstraintEngine(data)
+    engine = ConstraintEngine(data)
 
-        satisfied, results = engine.check_all(constraints)
+    satisfied, results = engine.check_all(constraints)
 
-        return {
-            "satisfied": satisfied,
-            "results": [r.to_dict() for r in results]
-        }
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+    # to_dict() already yields plain JSON types, so skip FastAPI's
+    # jsonable_encoder walk and serialize straight away
+    return JSONResponse({
+        "satisfied": satisfied,
+        "results": [r.to_dict() for r in results]
+    })
 
 
 # =============================================================================
@@ -841,4 +881,13 @@ async def check_constraints(country_code: str, constraints: dict):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host=config.API_HOST, port=config.API_PORT)
+    # "auto" picks uvloop/httptools (installed with uvicorn[standard]) where
+    # available and falls back to asyncio/h11 elsewhere, e.g. uvloop on Windows
+    uvicorn.run(
+        app,
+        host=config.API_HOST,
+        port=config.API_PORT,
+        loop="auto",
+        http="auto",
+        access_log=config.API_ACCESS_LOG
+    )
@@ -1,62 +1,89 @@
 # Pydantic data models package
+#
+# The country-state schema below is re-exported lazily: importing a map
+# submodule (backend.models.map, .units, ...) runs this file first, and
+# building every country model class up front would slow that import for
+# nothing. Each submodule is imported on first attribute access instead.
+from importlib import import_module
+from typing import Any
+
+_SUBMODULE_EXPORTS = {
+    "meta": ["TimeConfig", "GameDate", "Meta"],
+    "demographics": ["AgeGroup", "Demographics"],
+    "workforce": [
+        "EXPERTISE_POOLS",
+        "EducationLevel",
+        "ExpertisePool",
+        "MigrationBalance",
+        "Workforce",
+    ],
+    "infrastructure": [
+        "EnergyInfra",
+        "TransportInfra",
+        "DigitalInfra",
+        "WaterInfra",
+        "IndustrialFacilities",
+        "HealthcareFacilities",
+        "EducationFacilities",
+        "Infrastructure",
+    ],
+    "economy": ["Debt", "Reserves", "Economy"],
+    "budget": ["BudgetBreakdown", "BudgetAllocation", "RevenueSources", "Budget"],
+    "sectors": [
+        "SECTORS",
+        "WorkforceRequirement",
+        "InfrastructureRequirement",
+        "SectorConstraints",
+        "ProductionCapabilities",
+        "Subsector",
+        "Sector",
+    ],
+    "military": [
+        "BranchPersonnel",
+        "PersonnelConstraints",
+        "Personnel",
+        "ReadinessFactors",
+        "Readiness",
+        "AnnualMilitaryCosts",
+        "Military",
+    ],
+    "military_inventory": [
+        "OperationPrerequisites",
+        "PurchasePrerequisites",
+        "MilitaryAsset",
+        "MunitionStock",
+        "MilitaryInventory",
+    ],
+    "relations": [
+        "Aid",
+        "BilateralTrade",
+        "Dependencies",
+        "RelationshipFactors",
+        "ConflictFactors",
+        "BilateralRelation",
+    ],
+    "indices": ["Indices"],
+    "events": ["WeaponDefinition", "EventDefinition", "ActiveEvent"],
+    "country": ["CountryState"],
+}
+
+_EXPORT_MODULES = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORT_MODULES))
 
-from .meta import TimeConfig, GameDate, Meta
-from .demographics import AgeGroup, Demographics
-from .workforce import (
-    EXPERTISE_POOLS,
-    EducationLevel,
-    ExpertisePool,
-    MigrationBalance,
-    Workforce,
-)
-from .infrastructure import (
-    EnergyInfra,
-    TransportInfra,
-    DigitalInfra,
-    WaterInfra,
-    IndustrialFacilities,
-    HealthcareFacilities,
-    EducationFacilities,
-    Infrastructure,
-)
-from .economy import Debt, Reserves, Economy
-from .budget import BudgetBreakdown, BudgetAllocation, RevenueSources, Budget
-from .sectors import (
-    SECTORS,
-    WorkforceRequirement,
-    InfrastructureRequirement,
-    SectorConstraints,
-    ProductionCapabilities,
-    Subsector,
-    Sector,
-)
-from .military import (
-    BranchPersonnel,
-    PersonnelConstraints,
-    Personnel,
-    ReadinessFactors,
-    Readiness,
-    AnnualMilitaryCosts,
-    Military,
-)
-from .military_inventory import (
-    OperationPrerequisites,
-    PurchasePrerequisites,
-    MilitaryAsset,
-    MunitionStock,
-    MilitaryInventory,
-)
-from .relations import (
-    Aid,
-    BilateralTrade,
-    Dependencies,
-    RelationshipFactors,
-    ConflictFactors,
-    BilateralRelation,
-)
-from .indices import Indices
-from .events import WeaponDefinition, EventDefinition, ActiveEvent
-from .country import CountryState
 
 __all__ = [
     # Meta
@@ -2,12 +2,12 @@
 Active operation tracking model.
 Tracks ongoing military operations with progress and results.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Any, ClassVar, List, Optional, Dict
 from enum import Enum
 from datetime import datetime
 
-from .map import Coordinates
+from .map import Coordinates, filter_in_radius, IdIndexedList
 
 
 class OperationType(str, Enum):
@@ -37,20 +37,28 @@ class OperationStatus(str, Enum):
     ABORTED = "aborted"  # Cancelled mid-operation
 
 
+# Status groups for ActiveOperation.is_active/can_cancel and OperationsList.get_completed
+ACTIVE_STATUSES = frozenset({
+    OperationStatus.PLANNING, OperationStatus.DEPLOYING, OperationStatus.ACTIVE
+})
+CANCELLABLE_STATUSES = frozenset({OperationStatus.PLANNING, OperationStatus.DEPLOYING})
+COMPLETED_STATUSES = frozenset({OperationStatus.COMPLETED, OperationStatus.FAILED})
+
+
 class OperationResult(BaseModel):
     """Results of a completed operation."""
     success: bool
     objectives_achieved: int = 0
     objectives_total: int = 1
     enemy_casualties: int = 0
-    enemy_equipment_destroyed: Dict[str, int] = {}
+    enemy_equipment_destroyed: Dict[str, int] = Field(default_factory=dict)
     friendly_casualties: int = 0
-    friendly_equipment_lost: Dict[str, int] = {}
-    munitions_expended: Dict[str, int] = {}
+    friendly_equipment_lost: Dict[str, int] = Field(default_factory=dict)
+    munitions_expended: Dict[str, int] = Field(default_factory=dict)
     cost_millions: float = 0
     intelligence_gained: Optional[str] = None
     territory_gained_km2: float = 0
-    diplomatic_impact: Dict[str, int] = {}  # country_code -> relation change
+    diplomatic_impact: Dict[str, int] = Field(default_factory=dict)  # country_code -> relation change
 
 
 class ActiveOperation(BaseModel):
@@ -75,17 +83,17 @@ class ActiveOperation(BaseModel):
     target_country_code: Optional[str] = None
 
     # Units
-    assigned_unit_ids: List[str] = []
-    unit_types_involved: Dict[str, int] = {}  # unit_type -> count
+    assigned_unit_ids: List[str] = Field(default_factory=list)
+    unit_types_involved: Dict[str, int] = Field(default_factory=dict)  # unit_type -> count
 
     # Progress
     progress_percent: float = Field(default=0, ge=0, le=100)
     phase: str = "preparation"  # preparation, deployment, engagement, extraction
-    phases_completed: List[str] = []
+    phases_completed: List[str] = Field(default_factory=list)
 
     # Requirements
-    required_assets: Dict[str, int] = {}  # asset_type -> count required
-    munitions_allocated: Dict[str, int] = {}
+    required_assets: Dict[str, int] = Field(default_factory=dict)  # asset_type -> count required
+    munitions_allocated: Dict[str, int] = Field(default_factory=dict)
 
     # Success factors
     success_probability: float = Field(default=0.75, ge=0, le=1)
@@ -105,35 +113,37 @@ class ActiveOperation(BaseModel):
 
     def is_active(self) -> bool:
         """Check if operation is still ongoing."""
-        return self.status in [
-            OperationStatus.PLANNING,
-            OperationStatus.DEPLOYING,
-            OperationStatus.ACTIVE
-        ]
+        return self.status in ACTIVE_STATUSES
 
     def can_cancel(self) -> bool:
         """Check if operation can be cancelled."""
-        return self.status in [
-            OperationStatus.PLANNING,
-            OperationStatus.DEPLOYING
-        ]
+        return self.status in CANCELLABLE_STATUSES
+
 
+# Dumps a whole list of operations in one pydantic-core call
+_OPERATIONS_ADAPTER = TypeAdapter(List[ActiveOperation])
 
-class OperationsList(BaseModel):
+
+class OperationsList(IdIndexedList):
     """Collection of operations for a country."""
     country_code: str
-    operations: List[ActiveOperation] = []
+    operations: List[ActiveOperation] = Field(default_factory=list)
+
+    _items_field: ClassVar[str] = "operations"
+
+    @staticmethod
+    def dump_all(operations: List[ActiveOperation]) -> List[Dict[str, Any]]:
+        """Dump operations to dicts, as model_dump() would one by one."""
+        return _OPERATIONS_ADAPTER.dump_python(operations)
 
     def get_by_id(self, op_id: str) -> Optional[ActiveOperation]:
         """Get operation by ID."""
-        for op in self.operations:
-            if op.id == op_id:
-                return op
-        return None
+        i = self.index_of(op_id)
+        return self.operations[i] if i is not None else None
 
     def get_active(self) -> List[ActiveOperation]:
         """Get all active operations."""
-        return [op for op in self.operations if op.is_active()]
+        return [op for op in self.operations if op.status in ACTIVE_STATUSES]
 
     def get_by_type(self, op_type: OperationType) -> List[ActiveOperation]:
         """Get operations by type."""
@@ -145,14 +155,13 @@ class OperationsList(BaseModel):
 
     def get_completed(self) -> List[ActiveOperation]:
         """Get completed operations (success or failure)."""
-        return [
-            op for op in self.operations
-            if op.status in [OperationStatus.COMPLETED, OperationStatus.FAILED]
-        ]
+        return [op for op in self.operations if op.status in COMPLETED_STATUSES]
 
     def get_targeting_location(self, location: Coordinates, radius_km: float) -> List[ActiveOperation]:
         """Get operations targeting near a location."""
-        return [
-            op for op in self.operations
-            if op.is_active() and location.distance_to(op.target_location) <= radius_km
-        ]
+        return filter_in_radius(
+            location,
+            radius_km,
+            (op for op in self.operations if op.is_active()),
+            lambda op: op.target_location
+        )
@@ -2,11 +2,11 @@
 Military base data models for map system.
 Defines military installations and their capabilities.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Any, ClassVar, List, Optional, Dict
 from enum import Enum
 
-from .map import Coordinates
+from .map import Coordinates, filter_in_radius, IdIndexedList
 
 
 class BaseType(str, Enum):
@@ -58,7 +58,7 @@ class MilitaryBase(BaseModel):
 
     # Capacity and current usage
     capabilities: BaseCapabilities = Field(default_factory=BaseCapabilities)
-    stationed_unit_ids: List[str] = []
+    stationed_unit_ids: List[str] = Field(default_factory=list)
     current_personnel: int = 0
 
     # Operational status
@@ -80,17 +80,34 @@ class MilitaryBase(BaseModel):
     distance_to_city_km: float = 0
 
 
-class BaseList(BaseModel):
+# Validates or dumps a whole list of bases in one pydantic-core call
+_BASES_ADAPTER = TypeAdapter(List[MilitaryBase])
+
+
+class BaseList(IdIndexedList):
     """Collection of military bases for a country."""
     country_code: str
     bases: List[MilitaryBase]
 
+    _items_field: ClassVar[str] = "bases"
+
+    @classmethod
+    def from_raw(cls, country_code: str, raw_bases: List[Dict[str, Any]]) -> "BaseList":
+        """Build a base list from raw base dicts, e.g. as parsed from JSON."""
+        return cls.model_construct(
+            country_code=country_code,
+            bases=_BASES_ADAPTER.validate_python(raw_bases)
+        )
+
+    @staticmethod
+    def dump_all(bases: List[MilitaryBase]) -> List[Dict[str, Any]]:
+        """Dump bases to dicts, as model_dump() would one by one."""
+        return _BASES_ADAPTER.dump_python(bases)
+
     def get_by_id(self, base_id: str) -> Optional[MilitaryBase]:
         """Get base by ID."""
-        for base in self.bases:
-            if base.id == base_id:
-                return base
-        return None
+        i = self.index_of(base_id)
+        return self.bases[i] if i is not None else None
 
     def get_by_type(self, base_type: BaseType) -> List[MilitaryBase]:
         """Get all bases of a specific type."""
@@ -110,7 +127,4 @@ class BaseList(BaseModel):
 
     def get_bases_in_radius(self, center: Coordinates, radius_km: float) -> List[MilitaryBase]:
         """Get all bases within radius of a point."""
-        return [
-            base for base in self.bases
-            if center.distance_to(base.location) <= radius_km
-        ]
+        return filter_in_radius(center, radius_km, self.bases, lambda b: b.location)
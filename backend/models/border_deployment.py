@@ -2,11 +2,11 @@
 Border deployment zone models for tracking troop positions along borders.
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import ClassVar, List, Optional, Dict
 from enum import Enum
 from datetime import datetime
 
-from .map import Coordinates
+from .map import Coordinates, IdIndexedList
 
 
 class DeploymentAlertLevel(str, Enum):
@@ -34,8 +34,8 @@ class BorderDeploymentZone(BaseModel):
     max_capacity: int = Field(default=50000, ge=0)
 
     # Equipment deployment
-    deployed_unit_ids: List[str] = []
-    equipment_summary: Dict[str, int] = {}    # e.g., {"tanks": 50, "apcs": 120}
+    deployed_unit_ids: List[str] = Field(default_factory=list)
+    equipment_summary: Dict[str, int] = Field(default_factory=dict)  # e.g., {"tanks": 50, "apcs": 120}
 
     # Defense systems in zone
     air_defense_batteries: int = Field(default=0, ge=0)
@@ -67,21 +67,21 @@ class BorderDeploymentZone(BaseModel):
         return self.total_troops + additional <= self.max_capacity
 
 
-class BorderDeploymentList(BaseModel):
+class BorderDeploymentList(IdIndexedList):
     """All border deployment zones for a country."""
     country_code: str
-    zones: List[BorderDeploymentZone] = []
+    zones: List[BorderDeploymentZone] = Field(default_factory=list)
 
     # Aggregate stats
     total_active_deployed: int = 0
     total_reserves_deployed: int = 0
 
+    _items_field: ClassVar[str] = "zones"
+
     def get_by_id(self, zone_id: str) -> Optional[BorderDeploymentZone]:
         """Get zone by ID."""
-        for zone in self.zones:
-            if zone.id == zone_id:
-                return zone
-        return None
+        i = self.index_of(zone_id)
+        return self.zones[i] if i is not None else None
 
     def get_by_neighbor(self, neighbor_code: str) -> List[BorderDeploymentZone]:
         """Get all zones bordering a specific neighbor."""
@@ -93,8 +93,12 @@ class BorderDeploymentList(BaseModel):
 
     def recalculate_totals(self) -> None:
         """Recalculate aggregate totals from zone data."""
-        self.total_active_deployed = sum(z.active_troops for z in self.zones)
-        self.total_reserves_deployed = sum(z.reserve_troops for z in self.zones)
+        active = reserves = 0
+        for zone in self.zones:
+            active += zone.active_troops
+            reserves += zone.reserve_troops
+        self.total_active_deployed = active
+        self.total_reserves_deployed = reserves
 
 
 class TroopTransfer(BaseModel):
@@ -2,11 +2,11 @@
 City data models for map system.
 Defines cities, their attributes, and garrison information.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Any, ClassVar, List, Optional, Dict
 from enum import Enum
 
-from .map import Coordinates
+from .map import Coordinates, filter_in_radius, IdIndexedList
 
 
 class CityType(str, Enum):
@@ -58,12 +58,31 @@ class City(BaseModel):
     fortification_level: int = Field(default=0, ge=0, le=100)
 
 
-class CityList(BaseModel):
+# Validates or dumps a whole list of cities in one pydantic-core call
+_CITIES_ADAPTER = TypeAdapter(List[City])
+
+
+class CityList(IdIndexedList):
     """Collection of cities for a country."""
     country_code: str
     cities: List[City]
     total_urban_population: int = 0
 
+    _items_field: ClassVar[str] = "cities"
+
+    @classmethod
+    def from_raw(cls, country_code: str, raw_cities: List[Dict[str, Any]]) -> "CityList":
+        """Build a city list from raw city dicts, e.g. as parsed from JSON."""
+        return cls.model_construct(
+            country_code=country_code,
+            cities=_CITIES_ADAPTER.validate_python(raw_cities)
+        )
+
+    @staticmethod
+    def dump_all(cities: List[City]) -> List[Dict[str, Any]]:
+        """Dump cities to dicts, as model_dump() would one by one."""
+        return _CITIES_ADAPTER.dump_python(cities)
+
     def get_capital(self) -> Optional[City]:
         """Get the capital city."""
         for city in self.cities:
@@ -73,14 +92,9 @@ class CityList(BaseModel):
 
     def get_by_id(self, city_id: str) -> Optional[City]:
         """Get city by ID."""
-        for city in self.cities:
-            if city.id == city_id:
-                return city
-        return None
+        i = self.index_of(city_id)
+        return self.cities[i] if i is not None else None
 
     def get_cities_in_radius(self, center: Coordinates, radius_km: float) -> List[City]:
         """Get all cities within radius of a point."""
-        return [
-            city for city in self.cities
-            if center.distance_to(city.location) <= radius_km
-        ]
+        return filter_in_radius(center, radius_km, self.cities, lambda c: c.location)
@@ -2,10 +2,86 @@
 Geographic data models for map system.
 Provides coordinate system, regions, and terrain definitions.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional
+import math
+from math import asin, cos, sin, sqrt
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, TypeVar
 from enum import Enum
 
+EARTH_RADIUS_KM = 6371
+
+T = TypeVar("T")
+
+# Constants folded out of haversine_km, which runs once per item in radius queries
+_RAD = math.pi / 180
+_HALF_RAD = _RAD / 2
+_EARTH_DIAMETER_KM = 2 * EARTH_RADIUS_KM
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in km between two lat/lng points (degrees)."""
+    sin_dlat = sin((lat2 - lat1) * _HALF_RAD)
+    sin_dlng = sin((lng2 - lng1) * _HALF_RAD)
+
+    a = sin_dlat * sin_dlat + cos(lat1 * _RAD) * cos(lat2 * _RAD) * sin_dlng * sin_dlng
+    # asin(sqrt(a)) equals atan2(sqrt(a), sqrt(1 - a)) with one sqrt fewer;
+    # a only exceeds 1 through rounding, at antipodal points
+    if a >= 1:
+        return _EARTH_DIAMETER_KM * math.pi / 2
+    return _EARTH_DIAMETER_KM * asin(sqrt(a))
+
+
+def radius_degree_box(lat: float, radius_km: float) -> Tuple[float, float]:
+    """
+    Half-widths in degrees (lat, lng) of a box enclosing a circle on the globe.
+
+    Any point within radius_km of a center at latitude lat differs from it by
+    at most these many degrees, so the box is a safe prefilter before
+    haversine_km. The longitude half-width is 180 when the circle reaches a pole.
+    """
+    angular = radius_km / EARTH_RADIUS_KM
+    dlat = math.degrees(angular)
+    if abs(lat) + dlat >= 90 or angular >= math.pi / 2:
+        return dlat, 180.0
+    dlng = math.degrees(math.asin(min(1.0, math.sin(angular) / math.cos(math.radians(lat)))))
+    return dlat, dlng
+
+
+def filter_in_radius(
+    center: "Coordinates",
+    radius_km: float,
+    items: Iterable[T],
+    location_of: Callable[[T], "Coordinates"]
+) -> List[T]:
+    """Keep the items whose location is within radius_km of center."""
+    lat, lng = center.lat, center.lng
+    # Reject by a degree box enclosing the circle before paying for trig;
+    # the small slack keeps points exactly on the edge
+    dlat, dlng = radius_degree_box(lat, radius_km)
+    dlat += 1e-9
+    dlng += 1e-9
+
+    # Compare haversine's intermediate value against the radius mapped into
+    # the same space, so survivors skip sqrt/asin and the center's cosine is
+    # computed once per query rather than once per item
+    half_angle = radius_km / _EARTH_DIAMETER_KM
+    max_a = sin(half_angle) ** 2 * (1 + 1e-12) if half_angle < math.pi / 2 else 1.0
+    cos_lat = cos(lat * _RAD)
+
+    nearby = []
+    for item in items:
+        loc = location_of(item)
+        if abs(loc.lat - lat) > dlat:
+            continue
+        lng_diff = abs(loc.lng - lng)
+        if min(lng_diff, 360 - lng_diff) > dlng:
+            continue
+        sin_dlat = sin((loc.lat - lat) * _HALF_RAD)
+        sin_dlng = sin((loc.lng - lng) * _HALF_RAD)
+        if sin_dlat * sin_dlat + cos_lat * cos(loc.lat * _RAD) * sin_dlng * sin_dlng <= max_a:
+            nearby.append(item)
+    return nearby
+
 
 class TerrainType(str, Enum):
     URBAN = "urban"
@@ -25,17 +101,7 @@ class Coordinates(BaseModel):
 
     def distance_to(self, other: "Coordinates") -> float:
         """Calculate approximate distance in km using Haversine formula."""
-        import math
-        R = 6371  # Earth's radius in km
-
-        lat1, lat2 = math.radians(self.lat), math.radians(other.lat)
-        dlat = math.radians(other.lat - self.lat)
-        dlng = math.radians(other.lng - self.lng)
-
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-
-        return R * c
+        return haversine_km(self.lat, self.lng, other.lat, other.lng)
 
 
 class BoundingBox(BaseModel):
@@ -81,3 +147,23 @@ class MapData(BaseModel):
     borders: CountryBorders
     regions: List[MapRegion] = []
     neighbor_borders: List[CountryBorders] = []
+
+
+class IdIndexedList(BaseModel):
+    """Base for collections whose list field holds items with unique ids."""
+    # Name of the list field index_of() searches, set by each subclass
+    _items_field: ClassVar[str]
+
+    # item id -> position in the list; checked on every hit and rebuilt when stale
+    _positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def index_of(self, item_id: str) -> Optional[int]:
+        """Get the position of an item in the list by its ID."""
+        items = getattr(self, self._items_field)
+        i = self._positions.get(item_id)
+        if i is not None and i < len(items) and items[i].id == item_id:
+            return i
+
+        # Missing or stale (list was reordered or resized): rebuild once
+        self._positions = {item.id: i for i, item in enumerate(items)}
+        return self._positions.get(item_id)
@@ -2,12 +2,12 @@
 Military unit data models for map system.
 Tracks individual deployable units with positions and status.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Any, ClassVar, List, Optional, Dict
 from enum import Enum
 from datetime import datetime
 
-from .map import Coordinates
+from .map import Coordinates, filter_in_radius, IdIndexedList
 
 
 class UnitCategory(str, Enum):
@@ -31,6 +31,14 @@ class UnitStatus(str, Enum):
     DESTROYED = "destroyed"
 
 
+# Statuses a unit may be deployed from (see MilitaryUnit.can_deploy)
+DEPLOYABLE_STATUSES = frozenset({UnitStatus.IDLE, UnitStatus.DEPLOYED})
+
+# get_effective_strength's four percent factors and its 0.5-1.0 experience
+# factor, (100 + experience) / 200, folded into one divisor
+_STRENGTH_SCALE = 1 / (100 ** 4 * 200)
+
+
 class UnitMovement(BaseModel):
     """Tracks unit movement between locations."""
     origin: Coordinates
@@ -82,7 +90,7 @@ class MilitaryUnit(BaseModel):
     def can_deploy(self) -> bool:
         """Check if unit can be deployed."""
         return (
-            self.status in [UnitStatus.IDLE, UnitStatus.DEPLOYED] and
+            self.status in DEPLOYABLE_STATUSES and
             self.health_percent >= 50 and
             self.readiness_percent >= 50 and
             self.fuel_percent >= 20 and
@@ -91,26 +99,43 @@ class MilitaryUnit(BaseModel):
 
     def get_effective_strength(self) -> float:
         """Calculate effective combat strength (0-1)."""
-        health_factor = self.health_percent / 100
-        readiness_factor = self.readiness_percent / 100
-        supply_factor = min(self.fuel_percent, self.ammo_percent) / 100
-        morale_factor = self.morale / 100
-        experience_factor = 0.5 + (self.experience_level / 200)  # 0.5-1.0
+        fuel, ammo = self.fuel_percent, self.ammo_percent
+        supply = fuel if fuel < ammo else ammo
+
+        return (
+            self.health_percent * self.readiness_percent * supply * self.morale *
+            (100 + self.experience_level) * _STRENGTH_SCALE
+        )
 
-        return health_factor * readiness_factor * supply_factor * morale_factor * experience_factor
 
+# Validates or dumps a whole list of units in one pydantic-core call
+_UNITS_ADAPTER = TypeAdapter(List[MilitaryUnit])
 
-class UnitList(BaseModel):
+
+class UnitList(IdIndexedList):
     """Collection of military units for a country."""
     country_code: str
     units: List[MilitaryUnit]
 
+    _items_field: ClassVar[str] = "units"
+
+    @classmethod
+    def from_raw(cls, country_code: str, raw_units: List[Dict[str, Any]]) -> "UnitList":
+        """Build a unit list from raw unit dicts, e.g. as parsed from JSON."""
+        return cls.model_construct(
+            country_code=country_code,
+            units=_UNITS_ADAPTER.validate_python(raw_units)
+        )
+
+    @staticmethod
+    def dump_all(units: List[MilitaryUnit]) -> List[Dict[str, Any]]:
+        """Dump units to dicts, as model_dump() would one by one."""
+        return _UNITS_ADAPTER.dump_python(units)
+
     def get_by_id(self, unit_id: str) -> Optional[MilitaryUnit]:
         """Get unit by ID."""
-        for unit in self.units:
-            if unit.id == unit_id:
-                return unit
-        return None
+        i = self.index_of(unit_id)
+        return self.units[i] if i is not None else None
 
     def get_by_category(self, category: UnitCategory) -> List[MilitaryUnit]:
         """Get all units of a category."""
@@ -130,10 +155,7 @@ class UnitList(BaseModel):
 
     def get_in_radius(self, center: Coordinates, radius_km: float) -> List[MilitaryUnit]:
         """Get all units within radius of a point."""
-        return [
-            unit for unit in self.units
-            if center.distance_to(unit.location) <= radius_km
-        ]
+        return filter_in_radius(center, radius_km, self.units, lambda u: u.location)
 
     def get_in_operation(self, operation_id: str) -> List[MilitaryUnit]:
         """Get all units assigned to an operation."""
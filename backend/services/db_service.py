@@ -2,10 +2,15 @@
 Database service for JSON file operations.
 Handles all read/write operations for country data and game state.
 """
+import asyncio
+import functools
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from backend.config import config
+from backend.utils.files import atomic_write_text
 
 
 class DBService:
@@ -13,6 +18,25 @@ class DBService:
 
     def __init__(self):
         self.db_path = config.DB_PATH
+        # country_code -> (version, parsed data) for read-only callers, in LRU order
+        self._read_cache: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        # Reads run on the event loop and in worker threads, saves in worker threads
+        self._read_cache_lock = threading.Lock()
+        # catalog_name -> (version, parsed data); catalogs are static game data
+        self._catalog_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # country_code -> lock held by every writer across load -> mutate -> save
+        self._write_locks: Dict[str, asyncio.Lock] = {}
+
+    def country_lock(self, country_code: str) -> asyncio.Lock:
+        """
+        Get the write lock for a country.
+
+        Endpoints and game ticks both load, mutate and save the country file,
+        with saves in worker threads. Every writer holds this lock for the
+        whole round trip, so none can load state another is about to
+        replace and then save over it.
+        """
+        return self._write_locks.setdefault(country_code.upper(), asyncio.Lock())
 
     def load_country(self, country_code: str) -> Dict[str, Any]:
         """Load country state from JSON file."""
@@ -20,16 +44,82 @@ class DBService:
         if not file_path.exists():
             raise FileNotFoundError(f"Country {country_code} not found")
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return json.loads(f.read())
+
+    def read_country_versioned(self, country_code: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Load country state for read-only use, along with a version tag.
+
+        The parsed dict is shared between callers and reused until the file
+        changes on disk, so it must not be mutated. Use load_country() to get
+        a private copy to modify and save.
+
+        Returns:
+            Tuple of (version, data); version changes whenever the file does
+        """
+        code = country_code.upper()
+        file_path, version = self._country_version(country_code)
+        cached = self._cached_country(code, version)
+        if cached:
+            return cached
+
+        with open(file_path, "rb") as f:
+            entry = (version, json.loads(f.read()))
+        with self._read_cache_lock:
+            self._read_cache[code] = entry
+            self._read_cache.move_to_end(code)
+            while len(self._read_cache) > config.DB_READ_CACHE_SIZE:
+                self._read_cache.popitem(last=False)
+        return entry
+
+    def peek_country_versioned(self, country_code: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Get the cached read-only state if it still matches the file, without parsing.
+
+        Returns:
+            The (version, data) entry, or None when read_country_versioned()
+            would have to parse the file
+        """
+        _, version = self._country_version(country_code)
+        return self._cached_country(country_code.upper(), version)
+
+    def _country_version(self, country_code: str) -> Tuple[Path, str]:
+        """Get a country's file path and a version tag for its current contents."""
+        file_path = self.db_path / "countries" / f"{country_code.upper()}.json"
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Country {country_code} not found")
+        return file_path, f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    def _cached_country(self, code: str, version: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Get a read cache entry if it is for this version, marking it recently used."""
+        with self._read_cache_lock:
+            cached = self._read_cache.get(code)
+            if cached and cached[0] == version:
+                self._read_cache.move_to_end(code)
+                return cached
+        return None
+
+    def read_country(self, country_code: str) -> Dict[str, Any]:
+        """Load country state for read-only use (see read_country_versioned)."""
+        return self.read_country_versioned(country_code)[1]
 
     def save_country(self, country_code: str, data: Dict[str, Any]) -> None:
         """Save country state to JSON file."""
         file_path = self.db_path / "countries" / f"{country_code.upper()}.json"
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        indent = 2 if config.DB_PRETTY_JSON else None
+        text = json.dumps(data, indent=indent, ensure_ascii=False)
+
+        # Saves run in worker threads; never expose a half-written file
+        atomic_write_text(file_path, text)
+
+        # Don't rely on mtime resolution for our own writes
+        with self._read_cache_lock:
+            self._read_cache.pop(country_code.upper(), None)
 
     def list_countries(self) -> list[str]:
         """List all available country codes."""
@@ -51,8 +141,8 @@ class DBService:
                 "tick_count": 0
             }
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = json.loads(f.read())
             # Normalize date format
             if isinstance(data.get("current_date"), str):
                 parts = data["current_date"].split("-")
@@ -66,8 +156,9 @@ class DBService:
     def save_game_state(self, data: Dict[str, Any]) -> None:
         """Save global game state."""
         file_path = self.db_path / "game_state.json"
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        indent = 2 if config.DB_PRETTY_JSON else None
+        # Rarely written and shared by every country, so worth the fsync
+        atomic_write_text(file_path, json.dumps(data, indent=indent), fsync=True)
 
     def load_catalog(self, catalog_name: str) -> Dict[str, Any]:
         """Load a catalog file (weapons, events, constraints)."""
@@ -75,8 +166,38 @@ class DBService:
         if not file_path.exists():
             raise FileNotFoundError(f"Catalog {catalog_name} not found")
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return json.loads(f.read())
+
+    def read_catalog_versioned(self, catalog_name: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Load a catalog file for read-only use, along with a version tag.
+
+        The parsed dict is shared between callers and only re-read when the
+        file changes on disk, so it must not be mutated.
+
+        Returns:
+            Tuple of (version, data); version changes whenever the file does
+        """
+        file_path = self.db_path / "catalog" / f"{catalog_name}.json"
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Catalog {catalog_name} not found")
+
+        version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        cached = self._catalog_cache.get(catalog_name)
+        if cached and cached[0] == version:
+            return cached
+
+        with open(file_path, "rb") as f:
+            entry = (version, json.loads(f.read()))
+        self._catalog_cache[catalog_name] = entry
+        return entry
+
+    def read_catalog(self, catalog_name: str) -> Dict[str, Any]:
+        """Load a catalog file for read-only use (see read_catalog_versioned)."""
+        return self.read_catalog_versioned(catalog_name)[1]
 
     def load_relations_matrix(self) -> Dict[str, Any]:
         """Load the relations matrix."""
@@ -84,8 +205,8 @@ class DBService:
         if not file_path.exists():
             return {}
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return json.loads(f.read())
 
     def load_weapons_catalog(self) -> Dict[str, Any]:
         """Load the weapons catalog."""
@@ -94,6 +215,13 @@ class DBService:
         except FileNotFoundError:
             return {}
 
+    def read_weapons_catalog(self) -> Dict[str, Any]:
+        """Load the weapons catalog for read-only use (see read_catalog)."""
+        try:
+            return self.read_catalog("weapons_catalog")
+        except FileNotFoundError:
+            return {}
+
     def load_events_catalog(self) -> Dict[str, Any]:
         """Load the events catalog."""
         try:
@@ -101,6 +229,13 @@ class DBService:
         except FileNotFoundError:
             return {}
 
+    def read_events_catalog(self) -> Dict[str, Any]:
+        """Load the events catalog for read-only use (see read_catalog)."""
+        try:
+            return self.read_catalog("events_catalog")
+        except FileNotFoundError:
+            return {}
+
     def load_constraints(self) -> Dict[str, Any]:
         """Load the constraints definitions."""
         try:
@@ -111,3 +246,18 @@ class DBService:
 
 # Singleton instance
 db_service = DBService()
+
+
+def country_write(endpoint):
+    """
+    Run an endpoint's load -> mutate -> save under the country's write lock.
+
+    The endpoint must take a country_code argument. Game ticks hold the
+    same lock (see DBService.country_lock), so endpoint writes and tick
+    saves for a country never interleave.
+    """
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        async with db_service.country_lock(kwargs["country_code"]):
+            return await endpoint(*args, **kwargs)
+    return wrapper
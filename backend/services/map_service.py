@@ -3,17 +3,22 @@ Map service for loading and managing geographic data.
 Handles cities, bases, units, and border data.
 """
 import json
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Callable, Iterator
 
 from backend.config import config
+from backend.utils.files import atomic_write_text
 from backend.models.map import Coordinates, MapData, CountryBorders, BoundingBox
-from backend.models.cities import City, CityList, CityType, CityInfrastructure
-from backend.models.bases import MilitaryBase, BaseList, BaseType, BaseStatus, BaseCapabilities
-from backend.models.units import MilitaryUnit, UnitList, UnitCategory, UnitStatus
+from backend.models.cities import City, CityList, CityType
+from backend.models.bases import MilitaryBase, BaseList, BaseType
+from backend.models.units import MilitaryUnit, UnitList, UnitCategory
 from backend.models.active_operation import ActiveOperation, OperationsList
 
+# Parsed borders and the neighbor_data stored in the same file
+_BordersEntry = Tuple[Optional[CountryBorders], List[Dict[str, Any]]]
+
 
 class MapService:
     """Service for map-related data operations."""
@@ -21,45 +26,97 @@ class MapService:
     def __init__(self):
         self.db_path = config.DB_PATH
         self.map_path = self.db_path / "map"
-        self._cities_cache: Dict[str, CityList] = {}
-        self._bases_cache: Dict[str, BaseList] = {}
-        self._units_cache: Dict[str, UnitList] = {}
-        self._borders_cache: Dict[str, CountryBorders] = {}
-        self._operations_cache: Dict[str, OperationsList] = {}
+        # Per-country caches in LRU order, bounded by MAP_CACHE_SIZE; every
+        # change is saved as it is made, so evicting an entry loses nothing
+        self._cities_cache: "OrderedDict[str, CityList]" = OrderedDict()
+        self._bases_cache: "OrderedDict[str, BaseList]" = OrderedDict()
+        self._units_cache: "OrderedDict[str, UnitList]" = OrderedDict()
+        self._borders_cache: "OrderedDict[str, _BordersEntry]" = OrderedDict()
+        self._operations_cache: "OrderedDict[str, OperationsList]" = OrderedDict()
+        # (layer, country_code) -> (cached model, its dump) for static layers
+        self._dump_cache: "OrderedDict[Tuple[str, str], Tuple[Any, Any]]" = OrderedDict()
+        # Saves held back inside batch_writes(): (layer, country_code) -> list
+        self._batch_depth = 0
+        self._pending_writes: Dict[Tuple[str, str], Any] = {}
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: Any) -> Any:
+        """Look up a cache entry and mark it most recently used."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """Store a cache entry, evicting the least recently used past the cap."""
+        cache[key] = value
+        cache.move_to_end(key)
+        # Unsaved batch changes live only in the cache until the batch ends
+        while len(cache) > config.MAP_CACHE_SIZE and not self._batch_depth:
+            cache.popitem(last=False)
+
+    @contextmanager
+    def batch_writes(self) -> Iterator[None]:
+        """
+        Hold back unit and operation saves until the block exits.
+
+        A tick that updates many units or operations then encodes and writes
+        each file once instead of once per change. Batches may nest; the
+        outermost one writes.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write any saves held back by batch_writes()."""
+        pending, self._pending_writes = self._pending_writes, {}
+        for (layer, _), items in pending.items():
+            if layer == "units":
+                self._write_units(items)
+            else:
+                self._write_operations(items)
 
     def _ensure_map_dir(self):
         """Ensure map directory exists."""
         self.map_path.mkdir(parents=True, exist_ok=True)
 
+    def _write_json(self, file_path: Path, data: Dict[str, Any]) -> None:
+        """Write map data, compact unless DB_PRETTY_JSON is set."""
+        # json.dump() to a file always uses the pure-Python encoder; encoding
+        # to a string first lets compact output take the C fast path
+        indent = 2 if config.DB_PRETTY_JSON else None
+        text = json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+        atomic_write_text(file_path, text)
+
     # ==================== Cities ====================
 
     def load_cities(self, country_code: str) -> CityList:
         """Load cities for a country."""
-        if country_code in self._cities_cache:
-            return self._cities_cache[country_code]
+        cached = self._cache_get(self._cities_cache, country_code)
+        if cached is not None:
+            return cached
 
         file_path = self.map_path / f"cities_{country_code.upper()}.json"
         if not file_path.exists():
             return CityList(country_code=country_code, cities=[])
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        cities = []
-        for city_data in data.get("cities", []):
-            # Convert nested dicts to proper models
-            city_data["location"] = Coordinates(**city_data["location"])
-            city_data["city_type"] = CityType(city_data.get("city_type", "medium"))
-            if "infrastructure" in city_data:
-                city_data["infrastructure"] = CityInfrastructure(**city_data["infrastructure"])
-            cities.append(City(**city_data))
-
-        city_list = CityList(
-            country_code=country_code,
-            cities=cities,
-            total_urban_population=data.get("total_urban_population", sum(c.population for c in cities))
+        with open(file_path, "rb") as f:
+            data = json.loads(f.read())
+
+        raw_cities = data.get("cities", [])
+        for city_data in raw_cities:
+            city_data.setdefault("city_type", CityType.MEDIUM)
+
+        city_list = CityList.from_raw(country_code, raw_cities)
+        city_list.total_urban_population = data.get(
+            "total_urban_population", sum(c.population for c in city_list.cities)
         )
-        self._cities_cache[country_code] = city_list
+        self._cache_put(self._cities_cache, country_code, city_list)
         return city_list
 
     def save_cities(self, city_list: CityList) -> None:
@@ -70,13 +127,14 @@ class MapService:
         data = {
             "country_code": city_list.country_code,
             "total_urban_population": city_list.total_urban_population,
-            "cities": [city.model_dump() for city in city_list.cities]
+            "cities": CityList.dump_all(city_list.cities)
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        self._write_json(file_path, data)
 
-        self._cities_cache[city_list.country_code] = city_list
+        self._cache_put(self._cities_cache, city_list.country_code, city_list)
+        # The list may have been edited in place, so its identity proves nothing
+        self._dump_cache.pop(("cities", city_list.country_code), None)
 
     def get_city(self, country_code: str, city_id: str) -> Optional[City]:
         """Get a specific city by ID."""
@@ -87,27 +145,23 @@ class MapService:
 
     def load_bases(self, country_code: str) -> BaseList:
         """Load military bases for a country."""
-        if country_code in self._bases_cache:
-            return self._bases_cache[country_code]
+        cached = self._cache_get(self._bases_cache, country_code)
+        if cached is not None:
+            return cached
 
         file_path = self.map_path / f"bases_{country_code.upper()}.json"
         if not file_path.exists():
             return BaseList(country_code=country_code, bases=[])
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = json.loads(f.read())
 
-        bases = []
-        for base_data in data.get("bases", []):
-            base_data["location"] = Coordinates(**base_data["location"])
-            base_data["base_type"] = BaseType(base_data.get("base_type", "army_base"))
-            base_data["status"] = BaseStatus(base_data.get("status", "operational"))
-            if "capabilities" in base_data:
-                base_data["capabilities"] = BaseCapabilities(**base_data["capabilities"])
-            bases.append(MilitaryBase(**base_data))
+        raw_bases = data.get("bases", [])
+        for base_data in raw_bases:
+            base_data.setdefault("base_type", BaseType.ARMY_BASE)
 
-        base_list = BaseList(country_code=country_code, bases=bases)
-        self._bases_cache[country_code] = base_list
+        base_list = BaseList.from_raw(country_code, raw_bases)
+        self._cache_put(self._bases_cache, country_code, base_list)
         return base_list
 
     def save_bases(self, base_list: BaseList) -> None:
@@ -117,13 +171,12 @@ class MapService:
 
         data = {
             "country_code": base_list.country_code,
-            "bases": [base.model_dump() for base in base_list.bases]
+            "bases": BaseList.dump_all(base_list.bases)
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        self._write_json(file_path, data)
 
-        self._bases_cache[base_list.country_code] = base_list
+        self._cache_put(self._bases_cache, base_list.country_code, base_list)
 
     def get_base(self, country_code: str, base_id: str) -> Optional[MilitaryBase]:
         """Get a specific base by ID."""
@@ -134,41 +187,48 @@ class MapService:
 
     def load_units(self, country_code: str) -> UnitList:
         """Load military units for a country."""
-        if country_code in self._units_cache:
-            return self._units_cache[country_code]
+        cached = self._cache_get(self._units_cache, country_code)
+        if cached is not None:
+            return cached
 
         file_path = self.map_path / f"units_{country_code.upper()}.json"
         if not file_path.exists():
-            return UnitList(country_code=country_code, units=[])
+            # Cache the empty roster too, so callers share one instance and
+            # repeated lookups don't hit the filesystem
+            unit_list = UnitList(country_code=country_code, units=[])
+            self._cache_put(self._units_cache, country_code, unit_list)
+            return unit_list
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = json.loads(f.read())
 
-        units = []
-        for unit_data in data.get("units", []):
-            unit_data["location"] = Coordinates(**unit_data["location"])
-            unit_data["category"] = UnitCategory(unit_data.get("category", "ground"))
-            unit_data["status"] = UnitStatus(unit_data.get("status", "idle"))
-            units.append(MilitaryUnit(**unit_data))
+        raw_units = data.get("units", [])
+        for unit_data in raw_units:
+            unit_data.setdefault("category", UnitCategory.GROUND)
 
-        unit_list = UnitList(country_code=country_code, units=units)
-        self._units_cache[country_code] = unit_list
+        unit_list = UnitList.from_raw(country_code, raw_units)
+        self._cache_put(self._units_cache, country_code, unit_list)
         return unit_list
 
     def save_units(self, unit_list: UnitList) -> None:
         """Save military units for a country."""
+        self._cache_put(self._units_cache, unit_list.country_code, unit_list)
+        if self._batch_depth:
+            self._pending_writes[("units", unit_list.country_code)] = unit_list
+        else:
+            self._write_units(unit_list)
+
+    def _write_units(self, unit_list: UnitList) -> None:
+        """Write a unit list to its file."""
         self._ensure_map_dir()
         file_path = self.map_path / f"units_{unit_list.country_code.upper()}.json"
 
         data = {
             "country_code": unit_list.country_code,
-            "units": [unit.model_dump() for unit in unit_list.units]
+            "units": UnitList.dump_all(unit_list.units)
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-
-        self._units_cache[unit_list.country_code] = unit_list
+        self._write_json(file_path, data)
 
     def get_unit(self, country_code: str, unit_id: str) -> Optional[MilitaryUnit]:
         """Get a specific unit by ID."""
@@ -178,25 +238,37 @@ class MapService:
     def update_unit(self, country_code: str, unit: MilitaryUnit) -> None:
         """Update a specific unit."""
         unit_list = self.load_units(country_code)
-        for i, u in enumerate(unit_list.units):
-            if u.id == unit.id:
+        i = unit_list.index_of(unit.id)
+        if i is not None:
+            unit_list.units[i] = unit
+        self.save_units(unit_list)
+
+    def update_units_bulk(self, country_code: str, units: List[MilitaryUnit]) -> None:
+        """Update several units and write the unit file once."""
+        if not units:
+            return
+
+        unit_list = self.load_units(country_code)
+        for unit in units:
+            i = unit_list.index_of(unit.id)
+            if i is not None:
                 unit_list.units[i] = unit
-                break
         self.save_units(unit_list)
 
     # ==================== Borders ====================
 
-    def load_borders(self, country_code: str) -> Optional[CountryBorders]:
-        """Load border data for a country."""
-        if country_code in self._borders_cache:
-            return self._borders_cache[country_code]
+    def _load_borders_file(self, country_code: str) -> _BordersEntry:
+        """Load a borders file: the borders and its neighbor data."""
+        cached = self._cache_get(self._borders_cache, country_code)
+        if cached is not None:
+            return cached
 
         file_path = self.map_path / f"borders_{country_code.upper()}.json"
         if not file_path.exists():
-            return None
+            return None, []
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = json.loads(f.read())
 
         borders = CountryBorders(
             country_code=data["country_code"],
@@ -206,63 +278,57 @@ class MapService:
             land_area_km2=data["land_area_km2"],
             neighbors=data.get("neighbors", [])
         )
-        self._borders_cache[country_code] = borders
-        return borders
+        entry = (borders, data.get("neighbor_data", []))
+        self._cache_put(self._borders_cache, country_code, entry)
+        return entry
+
+    def load_borders(self, country_code: str) -> Optional[CountryBorders]:
+        """Load border data for a country."""
+        return self._load_borders_file(country_code)[0]
 
     def get_neighbor_data(self, country_code: str) -> List[Dict[str, Any]]:
         """Get data about neighboring countries."""
-        file_path = self.map_path / f"borders_{country_code.upper()}.json"
-        if not file_path.exists():
-            return []
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return data.get("neighbor_data", [])
+        return self._load_borders_file(country_code)[1]
 
     # ==================== Operations ====================
 
     def load_operations(self, country_code: str) -> OperationsList:
         """Load active operations for a country."""
-        if country_code in self._operations_cache:
-            return self._operations_cache[country_code]
+        cached = self._cache_get(self._operations_cache, country_code)
+        if cached is not None:
+            return cached
 
         file_path = self.map_path / f"operations_{country_code.upper()}.json"
         if not file_path.exists():
             return OperationsList(country_code=country_code, operations=[])
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        operations = []
-        for op_data in data.get("operations", []):
-            # Convert string dates to datetime
-            for date_field in ["created_at", "started_at", "estimated_completion", "completed_at"]:
-                if op_data.get(date_field):
-                    op_data[date_field] = datetime.fromisoformat(op_data[date_field])
-
-            op_data["origin_location"] = Coordinates(**op_data["origin_location"])
-            op_data["target_location"] = Coordinates(**op_data["target_location"])
-            operations.append(ActiveOperation(**op_data))
-
-        ops_list = OperationsList(country_code=country_code, operations=operations)
-        self._operations_cache[country_code] = ops_list
+        # Parse and validate straight from the file bytes in one pass;
+        # pydantic-core reads the ISO dates and nested locations itself
+        with open(file_path, "rb") as f:
+            ops_list = OperationsList.model_validate_json(f.read())
+        ops_list.country_code = country_code
+        self._cache_put(self._operations_cache, country_code, ops_list)
         return ops_list
 
     def save_operations(self, ops_list: OperationsList) -> None:
         """Save operations for a country."""
+        self._cache_put(self._operations_cache, ops_list.country_code, ops_list)
+        if self._batch_depth:
+            self._pending_writes[("operations", ops_list.country_code)] = ops_list
+        else:
+            self._write_operations(ops_list)
+
+    def _write_operations(self, ops_list: OperationsList) -> None:
+        """Write an operations list to its file."""
         self._ensure_map_dir()
         file_path = self.map_path / f"operations_{ops_list.country_code.upper()}.json"
 
         data = {
             "country_code": ops_list.country_code,
-            "operations": [op.model_dump() for op in ops_list.operations]
+            "operations": OperationsList.dump_all(ops_list.operations)
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-
-        self._operations_cache[ops_list.country_code] = ops_list
+        self._write_json(file_path, data)
 
     def add_operation(self, country_code: str, operation: ActiveOperation) -> None:
         """Add a new operation."""
@@ -278,16 +344,31 @@ class MapService:
     def update_operation(self, country_code: str, operation: ActiveOperation) -> None:
         """Update an operation."""
         ops_list = self.load_operations(country_code)
-        for i, op in enumerate(ops_list.operations):
-            if op.id == operation.id:
-                ops_list.operations[i] = operation
-                break
+        i = ops_list.index_of(operation.id)
+        if i is not None:
+            ops_list.operations[i] = operation
         self.save_operations(ops_list)
 
     # ==================== Full Map Data ====================
 
+    def _dump_static(self, layer: str, country_code: str, source: Any, dump: Callable[[], Any]) -> Any:
+        """Dump a static map layer, reusing the result while source is the cached model."""
+        key = (layer, country_code)
+        cached = self._cache_get(self._dump_cache, key)
+        if cached and cached[0] is source:
+            return cached[1]
+
+        dumped = dump()
+        self._cache_put(self._dump_cache, key, (source, dumped))
+        return dumped
+
     def get_full_map_data(self, country_code: str) -> Dict[str, Any]:
-        """Get complete map data for a country."""
+        """
+        Get complete map data for a country.
+
+        Cities and borders are static game data, so their dumps are reused
+        until the layer is saved or reloaded; the result must not be mutated.
+        """
         cities = self.load_cities(country_code)
         bases = self.load_bases(country_code)
         units = self.load_units(country_code)
@@ -297,11 +378,15 @@ class MapService:
 
         return {
             "country_code": country_code,
-            "borders": borders.model_dump() if borders else None,
-            "cities": [c.model_dump() for c in cities.cities],
-            "bases": [b.model_dump() for b in bases.bases],
-            "units": [u.model_dump() for u in units.units],
-            "active_operations": [op.model_dump() for op in operations.get_active()],
+            "borders": self._dump_static(
+                "borders", country_code, borders, lambda: borders.model_dump() if borders else None
+            ),
+            "cities": self._dump_static(
+                "cities", country_code, cities, lambda: CityList.dump_all(cities.cities)
+            ),
+            "bases": BaseList.dump_all(bases.bases),
+            "units": UnitList.dump_all(units.units),
+            "active_operations": OperationsList.dump_all(operations.get_active()),
             "neighbors": neighbors
         }
 
@@ -313,12 +398,15 @@ class MapService:
             self._units_cache.pop(country_code, None)
             self._borders_cache.pop(country_code, None)
             self._operations_cache.pop(country_code, None)
+            self._dump_cache.pop(("cities", country_code), None)
+            self._dump_cache.pop(("borders", country_code), None)
         else:
             self._cities_cache.clear()
             self._bases_cache.clear()
             self._units_cache.clear()
             self._borders_cache.clear()
             self._operations_cache.clear()
+            self._dump_cache.clear()
 
 
 # Singleton instance
@@ -5,7 +5,6 @@ Handles troop deployment, reserve callups, and threat assessment.
 import json
 from pathlib import Path
 from typing import Optional, Dict, List, Any
-from datetime import datetime
 
 from backend.config import config
 from backend.models.border_deployment import (
@@ -17,6 +16,7 @@ from backend.models.border_deployment import (
 from backend.models.map import Coordinates
 from backend.services.db_service import db_service
 from backend.services.map_service import map_service
+from backend.utils.files import atomic_write_text
 
 
 class MilitaryService:
@@ -44,25 +44,10 @@ class MilitaryService:
             # Initialize from border data if no deployments exist
             return self.initialize_from_borders(country_code)
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        zones = []
-        for zone_data in data.get("zones", []):
-            zone_data["center"] = Coordinates(**zone_data["center"])
-            zone_data["alert_level"] = DeploymentAlertLevel(
-                zone_data.get("alert_level", "peacetime")
-            )
-            if zone_data.get("last_incident"):
-                zone_data["last_incident"] = datetime.fromisoformat(zone_data["last_incident"])
-            zones.append(BorderDeploymentZone(**zone_data))
-
-        deployment_list = BorderDeploymentList(
-            country_code=country_code,
-            zones=zones,
-            total_active_deployed=data.get("total_active_deployed", 0),
-            total_reserves_deployed=data.get("total_reserves_deployed", 0)
-        )
+        # Parse and validate straight from the file bytes in one pass
+        with open(file_path, "rb") as f:
+            deployment_list = BorderDeploymentList.model_validate_json(f.read())
+        deployment_list.country_code = country_code
         self._deployments_cache[country_code] = deployment_list
         return deployment_list
 
@@ -81,8 +66,11 @@ class MilitaryService:
             "total_reserves_deployed": deployments.total_reserves_deployed
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        # Encode in one go (C encoder when compact) rather than json.dump()'s
+        # chunked pure-Python path, then write once
+        indent = 2 if config.DB_PRETTY_JSON else None
+        text = json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+        atomic_write_text(file_path, text)
 
         self._deployments_cache[deployments.country_code] = deployments
 
@@ -0,0 +1,32 @@
+"""
+File helpers shared by the JSON-backed services.
+"""
+import os
+import threading
+from pathlib import Path
+
+
+def atomic_write_text(file_path: Path, text: str, fsync: bool = False) -> None:
+    """
+    Replace a file's contents without ever exposing a partial file.
+
+    The text is written in one call to a temporary file beside the target,
+    which is then swapped in with os.replace(), so concurrent readers and
+    crashes see either the old contents or the new ones.
+
+    Args:
+        file_path: File to write
+        text: Full new contents
+        fsync: Flush the data to disk before the swap
+    """
+    tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -3,10 +3,19 @@ Integration tests for API endpoints that were reported as broken.
 Tests: Procurement, Operations, Sectors APIs
 """
 
+import asyncio
+import shutil
+import time
+from datetime import date
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
-from backend.main import app
+from backend.engine.clock_service import clock_service
+from backend.engine.tick_processor import TickProcessor
+from backend.main import app, country_write, set_readiness
+from backend.services.db_service import db_service
 
 
 @pytest.fixture
@@ -15,6 +24,91 @@ def client():
     return TestClient(app)
 
 
+# =============================================================================
+# Country API Tests
+# =============================================================================
+
+class TestCountryAPI:
+    """Test Country API endpoints."""
+
+    def test_get_country_etag(self, client):
+        """Test that an unchanged country answers If-None-Match with 304."""
+        response = client.get("/api/country/ISR")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        cached = client.get("/api/country/ISR", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+    def test_get_country_not_found(self, client):
+        """Test getting an unknown country."""
+        response = client.get("/api/country/XXX")
+        assert response.status_code == 404
+
+    def test_country_section_not_found(self, client):
+        """Test read-only country endpoints share the 404 for unknown countries."""
+        for path in ("economy", "relations"):
+            response = client.get(f"/api/country/XXX/{path}")
+            assert response.status_code == 404
+            assert response.json()["detail"] == "Country XXX not found"
+
+    async def test_country_writes_are_serialized(self):
+        """Test that writes for one country run one after another."""
+        order = []
+
+        @country_write
+        async def endpoint(country_code: str):
+            order.append(("start", country_code))
+            await asyncio.sleep(0)
+            order.append(("end", country_code))
+
+        await asyncio.gather(
+            endpoint(country_code="isr"),
+            endpoint(country_code="ISR"),
+            endpoint(country_code="USA")
+        )
+
+        isr = [step for step, code in order if code.upper() == "ISR"]
+        assert isr == ["start", "end", "start", "end"]
+        assert order.index(("start", "USA")) < order.index(("end", "isr"))
+
+    async def test_tick_and_endpoint_writes_both_land(self, tmp_path, monkeypatch):
+        """Test that a tick running alongside a write endpoint keeps its change."""
+        db_dir = Path(__file__).parent.parent / "db"
+        shutil.copytree(db_dir / "countries", tmp_path / "countries")
+        shutil.copytree(db_dir / "catalog", tmp_path / "catalog")
+        monkeypatch.setattr(db_service, "db_path", tmp_path)
+        monkeypatch.setattr(db_service, "_read_cache", type(db_service._read_cache)())
+        monkeypatch.setattr(db_service, "_catalog_cache", {})
+        monkeypatch.setattr(db_service, "_write_locks", {})
+
+        processor = TickProcessor("ISR", db_service)
+        loop = asyncio.get_running_loop()
+        tick_loaded = asyncio.Event()
+        init_engines = processor._init_engines
+
+        def slow_init_engines(data):
+            # Hold the tick between its load and its save while the endpoint runs
+            loop.call_soon_threadsafe(tick_loaded.set)
+            time.sleep(0.05)
+            init_engines(data)
+
+        monkeypatch.setattr(processor, "_init_engines", slow_init_engines)
+        try:
+            tick = asyncio.create_task(processor.on_monthly(date(2024, 2, 1), 31))
+            await tick_loaded.wait()
+            result = await set_readiness(country_code="ISR", level="maximum")
+            await tick
+        finally:
+            clock_service.unregister_batch_handler(processor.on_tick_batch)
+
+        assert result["success"]
+        data = db_service.load_country("ISR")
+        assert data["military"]["readiness"]["overall"] == 100
+        assert "last_economic_update" in data["meta"]
+
+
 # =============================================================================
 # Procurement API Tests
 # =============================================================================
@@ -29,6 +123,17 @@ class TestProcurementAPI:
         data = response.json()
         assert "catalog" in data
 
+    def test_get_catalog_etag(self, client):
+        """Test that the catalog is cacheable and answers If-None-Match with 304."""
+        response = client.get("/api/procurement/catalog?category=aircraft")
+        assert response.status_code == 200
+        assert "max-age" in response.headers["cache-control"]
+        etag = response.headers["etag"]
+
+        cached = client.get("/api/procurement/catalog?category=aircraft", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
     def test_get_catalog_with_category(self, client):
         """Test getting weapons catalog filtered by category."""
         response = client.get("/api/procurement/catalog?category=aircraft")
@@ -69,6 +174,10 @@ class TestOperationsAPI:
         data = response.json()
         assert "types" in data
         assert "details" in data
+        assert set(data["details"]) == set(data["types"])
+
+        cached = client.get("/api/operations/types", headers={"If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304
 
     def test_plan_operation(self, client):
         """Test planning an operation."""
@@ -172,6 +281,23 @@ class TestBudgetAPI:
         assert isinstance(data, dict)
 
 
+# =============================================================================
+# Constraints API Tests
+# =============================================================================
+
+class TestConstraintsAPI:
+    """Test Constraints API endpoints."""
+
+    def test_check_constraints(self, client):
+        """Test checking constraints returns plain JSON results."""
+        response = client.post("/api/constraints/ISR/check", json={"political": 5})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["satisfied"] is True
+        assert data["results"][0]["constraint_type"] == "political"
+        assert data["results"][0]["required_value"] == 5
+
+
 # =============================================================================
 # Regression Tests for Bug Fixes (2026-01-02)
 # =============================================================================
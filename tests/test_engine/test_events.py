@@ -387,3 +387,27 @@ class TestRelationsCount:
         count = engine._count_alliances()
 
         assert count == 1
+
+    def test_check_events_tallies_relations_once(self, sample_country_data):
+        """Relation conditions across the catalog should share one pass"""
+        catalog = {
+            'border_clash': {
+                'base_probability_annual': 0.0,
+                'triggers': {'hostile_neighbors > 0': {'add': 0.1}},
+                'prevention': {'strong_alliances > 0': {'subtract': 0.1}}
+            },
+            'trade_deal': {
+                'base_probability_annual': 0.0,
+                'triggers': {'good_relations > 0': {'add': 0.1}},
+                'prevention': {}
+            }
+        }
+        engine = EventEngine(sample_country_data, catalog)
+
+        with patch.object(engine, '_tally_relations', wraps=engine._tally_relations) as tally:
+            engine.check_events()
+        assert tally.call_count == 1
+
+        # Counts are fresh again outside check_events
+        sample_country_data['relations']['ENM'] = {'score': -50}
+        assert engine._count_hostile_relations() == 1
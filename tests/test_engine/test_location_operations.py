@@ -418,6 +418,25 @@ class TestLocationOperationsEngine:
         op = map_service.get_operation("TST", create_result['operation_id'])
         assert op.progress_percent > 0
 
+    def test_process_operations_skips_finished(self, ops_engine):
+        """Test that finished operations are left alone."""
+        target = Coordinates(lat=32.0, lng=34.5)
+        success, create_result = ops_engine.create_operation(
+            operation_type="air_strike",
+            name="Strike Bravo",
+            target_location=target,
+            unit_ids=["fighter_1"]
+        )
+
+        from backend.services.map_service import map_service
+        op = map_service.get_operation("TST", create_result['operation_id'])
+        op.status = OperationStatus.COMPLETED
+        op.started_at = datetime.utcnow() - timedelta(hours=1)
+        map_service.update_operation("TST", op)
+
+        assert ops_engine.process_operations(datetime.utcnow()) == []
+        assert map_service.get_operation("TST", create_result['operation_id']).progress_percent == 0
+
     # ==================== Summary Tests ====================
 
     def test_get_operation_summary(self, ops_engine):
@@ -442,6 +461,7 @@ class TestLocationOperationsEngine:
         summary = ops_engine.get_operation_summary()
 
         assert summary['total'] == 2
+        assert summary['active'] == 2
         assert 'by_status' in summary
         assert 'by_type' in summary
 
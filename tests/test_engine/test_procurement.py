@@ -25,6 +25,29 @@ class TestCatalogAccess:
         assert len(aircraft) == 1
         assert "F-35" in aircraft
 
+    def test_get_catalog_unknown_category(self, sample_country_data, sample_weapons_catalog):
+        """Unknown categories should give an empty catalog"""
+        engine = ProcurementEngine(sample_country_data, sample_weapons_catalog)
+
+        assert engine.get_catalog("spacecraft") == {}
+
+    def test_nested_catalog_lists_full_ids(self, sample_country_data):
+        """Nested catalogs should list full IDs only, but accept short ones"""
+        nested = {'weapons': {'aircraft': {'F-16': {'cost': 30_000_000}}}}
+        engine = ProcurementEngine(sample_country_data, nested)
+
+        assert list(engine.get_catalog()) == ['aircraft.F-16']
+        assert list(engine.get_catalog('aircraft')) == ['aircraft.F-16']
+        assert engine.catalog['F-16']['unit_cost_millions'] == 30
+
+    def test_catalog_views_shared_for_same_catalog(self, sample_country_data, sample_weapons_catalog):
+        """Engines over the same catalog dict should reuse one flattening"""
+        first = ProcurementEngine(sample_country_data, sample_weapons_catalog)
+        second = ProcurementEngine(deepcopy(sample_country_data), sample_weapons_catalog)
+
+        assert second.catalog is first.catalog
+        assert second.get_catalog("aircraft") is first.get_catalog("aircraft")
+
 
 class TestPurchaseEligibility:
     """Test purchase eligibility checking"""
@@ -0,0 +1,227 @@
+# tests/test_engine/test_sectors.py
+import pytest
+from backend.engine.sector_engine import SectorEngine
+
+
+class TestInfrastructureProjects:
+    """Test infrastructure project lifecycle"""
+
+    def test_completion_applies_nested_effects(self, sample_country_data):
+        """Completed project should add its effects to infrastructure"""
+        engine = SectorEngine(sample_country_data)
+        result = engine.start_infrastructure_project('hospital')
+        assert result['success']
+
+        for _ in range(SectorEngine.INFRASTRUCTURE_PROJECTS['hospital']['duration_quarters']):
+            completed = engine.process_quarterly_progress()
+
+        assert len(completed) == 1
+        healthcare = sample_country_data['infrastructure']['healthcare']
+        assert healthcare['hospitals'] == 1
+        assert healthcare['beds_per_1000'] == pytest.approx(0.2)
+
+    def test_completion_adds_to_existing_value(self, sample_country_data):
+        """Numeric effects should accumulate onto existing values"""
+        sample_country_data['infrastructure']['transport'] = {'highway_km': 500}
+        engine = SectorEngine(sample_country_data)
+
+        engine._complete_infrastructure_project({
+            'effects': SectorEngine.INFRASTRUCTURE_PROJECTS['highway']['effects']
+        })
+
+        assert sample_country_data['infrastructure']['transport']['highway_km'] == 600
+
+    def test_boolean_effect_overwrites(self, sample_country_data):
+        """Boolean effects should be set, not added"""
+        engine = SectorEngine(sample_country_data)
+
+        engine._complete_infrastructure_project({
+            'effects': {'industrial.military_production_capability': True}
+        })
+
+        assert sample_country_data['infrastructure']['industrial']['military_production_capability'] is True
+
+    def test_project_names(self, sample_country_data):
+        """Projects get a readable default name unless one is given"""
+        engine = SectorEngine(sample_country_data)
+
+        default = engine.start_infrastructure_project('data_center')
+        custom = engine.start_infrastructure_project('hospital', 'Rambam Annex')
+
+        assert default['project']['name'] == 'Data Center'
+        assert custom['project']['name'] == 'Rambam Annex'
+
+
+class TestProjectManagement:
+    """Test active project bookkeeping"""
+
+    def test_cancel_removes_project_in_place(self, sample_country_data):
+        """Cancelling should drop the project from the shared list"""
+        projects = sample_country_data['active_projects']
+        engine = SectorEngine(sample_country_data)
+        project_id = engine.start_infrastructure_project('hospital')['project']['id']
+
+        result = engine.cancel_project(project_id)
+
+        assert result['success']
+        assert result['cancelled_project']['status'] == 'cancelled'
+        assert sample_country_data['active_projects'] is projects
+        assert projects == []
+
+    def test_cancel_unknown_project(self, sample_country_data):
+        """Unknown project IDs should be reported"""
+        engine = SectorEngine(sample_country_data)
+        result = engine.cancel_project('does_not_exist')
+
+        assert not result['success']
+        assert 'not found' in result['error']
+
+    def test_cancel_keeps_other_projects(self, sample_country_data):
+        """Only the matching project should be removed"""
+        sample_country_data['active_projects'].append({
+            'id': 'order_1', 'type': 'weapon_procurement', 'status': 'ordered'
+        })
+        engine = SectorEngine(sample_country_data)
+        project_id = engine.start_infrastructure_project('hospital')['project']['id']
+
+        engine.cancel_project(project_id)
+
+        assert [p['id'] for p in sample_country_data['active_projects']] == ['order_1']
+
+    def test_quarterly_progress_keeps_unfinished(self, sample_country_data):
+        """Unfinished and non-sector projects should stay active"""
+        sample_country_data['active_projects'].append({
+            'id': 'order_1', 'type': 'weapon_procurement', 'status': 'ordered'
+        })
+        projects = sample_country_data['active_projects']
+        engine = SectorEngine(sample_country_data)
+        engine.start_infrastructure_project('hospital')
+        engine.start_infrastructure_project('power_plant')
+
+        for _ in range(4):
+            completed = engine.process_quarterly_progress()
+
+        assert [p['subtype'] for p in completed] == ['hospital']
+        assert sample_country_data['active_projects'] is projects
+        assert [p.get('subtype', p['id']) for p in projects] == ['order_1', 'power_plant']
+
+    def test_describe_projects_without_engine(self, sample_country_data):
+        """Project listings can be built from raw data without touching it"""
+        SectorEngine(sample_country_data).start_infrastructure_project('hospital')
+        projects = sample_country_data['active_projects']
+
+        listing = SectorEngine.describe_projects(projects)
+
+        assert listing == SectorEngine(sample_country_data).get_active_projects()
+        assert listing[0]['project_type'] == 'hospital'
+        assert listing[0]['progress'] == 0
+
+    def test_quarterly_progress_drops_stale_completed(self, sample_country_data):
+        """Projects already marked completed should be cleared out"""
+        sample_country_data['active_projects'].extend([
+            {'id': 'old', 'type': 'infrastructure', 'status': 'completed'},
+            {'id': 'order_1', 'type': 'weapon_procurement', 'status': 'ordered'}
+        ])
+        engine = SectorEngine(sample_country_data)
+
+        completed = engine.process_quarterly_progress()
+
+        assert completed == []
+        assert [p['id'] for p in sample_country_data['active_projects']] == ['order_1']
+
+
+class TestSectorInvestment:
+    """Test sector investment constraint checks"""
+
+    def test_invest_checks_sector_requirements(self, sample_country_data):
+        """Sectors with workforce requirements should report missing pools"""
+        engine = SectorEngine(sample_country_data)
+        result = engine.invest_in_sector('technology', 1.0)
+
+        assert not result['success']
+        failed_types = {c['constraint_type'] for c in result['failed_constraints']}
+        assert 'workforce' in failed_types
+
+    def test_invest_budget_only_sector(self, sample_country_data):
+        """Sectors without requirements only need development budget"""
+        sample_country_data['sectors']['services'] = {'level': 50}
+        engine = SectorEngine(sample_country_data)
+
+        result = engine.invest_in_sector('services', 1.0)
+
+        assert result['success']
+        assert result['project']['sector'] == 'services'
+
+    def test_invest_budget_only_sector_over_budget(self, sample_country_data):
+        """Budget-only sectors should still fail when development budget is short"""
+        sample_country_data['sectors']['services'] = {'level': 50}
+        engine = SectorEngine(sample_country_data)
+
+        result = engine.invest_in_sector('services', 100.0)
+
+        assert not result['success']
+        assert [c['constraint_type'] for c in result['failed_constraints']] == ['budget']
+
+    def test_invest_rejects_non_positive_amount(self, sample_country_data):
+        """Zero or negative investments should fail before constraint checks"""
+        engine = SectorEngine(sample_country_data)
+        result = engine.invest_in_sector('manufacturing', 0)
+
+        assert not result['success']
+        assert 'failed_constraints' not in result
+
+    def test_invest_rejects_below_one_level_cost(self, sample_country_data):
+        """Investments too small to buy a single level should be rejected"""
+        engine = SectorEngine(sample_country_data)
+        result = engine.invest_in_sector('manufacturing', 0.5)
+
+        assert not result['success']
+        assert 'Minimum investment' in result['error']
+        assert sample_country_data['active_projects'] == []
+
+    def test_invest_rejects_maxed_sector(self, sample_country_data):
+        """Sectors at level 100 cannot be improved"""
+        sample_country_data['sectors']['manufacturing']['level'] = 100
+        engine = SectorEngine(sample_country_data)
+        result = engine.invest_in_sector('manufacturing', 1.0)
+
+        assert not result['success']
+        assert 'maximum level' in result['error']
+
+
+class TestSectorSummary:
+    """Test sector summary output"""
+
+    def test_aggregate_summary_defaults(self, sample_country_data):
+        """Missing sector fields should fall back to defaults"""
+        sample_country_data['sectors']['services'] = {}
+        engine = SectorEngine(sample_country_data)
+
+        summary = engine.get_sector_summary()
+
+        assert summary['technology'] == {
+            'level': 75, 'gdp_contribution': 60, 'employment': 300_000
+        }
+        assert summary['services'] == {'level': 50, 'gdp_contribution': 0, 'employment': 0}
+
+
+
+class TestBudgetDeduction:
+    """Test project cost deduction"""
+
+    def test_deducts_from_infrastructure_allocation(self, sample_country_data):
+        """Costs come out of the infrastructure allocation when it suffices"""
+        engine = SectorEngine(sample_country_data)
+        engine._deduct_budget(2.0)
+
+        assert sample_country_data['budget']['allocation']['infrastructure']['amount'] == 8
+        assert sample_country_data['budget']['total_expenditure_billions'] == 150
+
+    def test_falls_back_to_total_expenditure(self, sample_country_data):
+        """Costs beyond the allocation raise total expenditure instead"""
+        del sample_country_data['budget']['allocation']['infrastructure']
+        engine = SectorEngine(sample_country_data)
+        engine._deduct_budget(2.0)
+
+        assert 'infrastructure' not in sample_country_data['budget']['allocation']
+        assert sample_country_data['budget']['total_expenditure_billions'] == 152
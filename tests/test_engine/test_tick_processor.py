@@ -0,0 +1,215 @@
+# tests/test_engine/test_tick_processor.py
+import asyncio
+import pytest
+from copy import deepcopy
+from datetime import date
+
+from backend.engine.clock_service import ClockService, TickType, clock_service
+from backend.engine.tick_processor import TickProcessor
+from backend.services.db_service import DBService
+
+
+class FakeDBService:
+    """In-memory stand-in for DBService that counts file round-trips"""
+
+    def __init__(self, country_data, weapons_catalog, events_catalog):
+        self.country_data = country_data
+        self.weapons_catalog = weapons_catalog
+        self.events_catalog = events_catalog
+        self.loads = 0
+        self.saves = 0
+        self.locks = {}
+
+    def country_lock(self, country_code):
+        return self.locks.setdefault(country_code, asyncio.Lock())
+
+    def load_country(self, country_code):
+        self.loads += 1
+        return deepcopy(self.country_data)
+
+    def save_country(self, country_code, data):
+        self.saves += 1
+        self.country_data = deepcopy(data)
+
+    def load_weapons_catalog(self):
+        return self.weapons_catalog
+
+    def read_weapons_catalog(self):
+        return self.weapons_catalog
+
+    def load_events_catalog(self):
+        return self.events_catalog
+
+    def read_events_catalog(self):
+        return self.events_catalog
+
+
+@pytest.fixture
+def fake_db(sample_country_data, sample_weapons_catalog, sample_events_catalog):
+    return FakeDBService(sample_country_data, sample_weapons_catalog, sample_events_catalog)
+
+
+@pytest.fixture
+def processor(fake_db):
+    processor = TickProcessor("TST", fake_db)
+    yield processor
+    clock_service.unregister_batch_handler(processor.on_tick_batch)
+
+
+class TestTickBatching:
+    """Test coalesced tick processing"""
+
+    async def test_year_boundary_single_round_trip(self, processor, fake_db):
+        """All ticks on one day should share a single load and save"""
+        tick_types = [TickType.DAILY, TickType.MONTHLY, TickType.QUARTERLY, TickType.YEARLY]
+
+        await processor.on_tick_batch(date(2025, 1, 1), 366, tick_types)
+
+        assert fake_db.loads == 1
+        assert fake_db.saves == 1
+        meta = fake_db.country_data['meta']
+        assert meta['current_date'] == {'year': 2025, 'month': 1, 'day': 1}
+        assert meta['total_game_days_elapsed'] == 366
+        assert 'last_economic_update' in meta
+        assert 'last_demographic_update' in meta
+
+    async def test_yearly_runs_demographics_and_deliveries(self, processor, fake_db):
+        """Yearly tick should apply both demographic changes and deliveries"""
+        fake_db.country_data['active_projects'].append({
+            'id': 'order_1',
+            'type': 'weapon_procurement',
+            'weapon_id': 'F-35',
+            'weapon_model': 'F-35 Lightning II',
+            'quantity': 4,
+            'delivered': 0,
+            'delivery_per_year': 4,
+            'delivery_start_year': 2025,
+            'source_country': 'USA',
+            'status': 'ordered'
+        })
+        old_population = fake_db.country_data['demographics']['total_population']
+
+        await processor.on_yearly(date(2025, 1, 1), 366)
+
+        data = fake_db.country_data
+        assert data['recent_deliveries'][0]['quantity'] == 4
+        assert data['active_projects'] == []
+        assert data['demographics']['total_population'] != old_population
+
+    async def test_engine_tick_holds_country_lock(self, processor, fake_db):
+        """Writers taking the country lock should wait for the tick's save"""
+        tick = asyncio.create_task(processor.on_monthly(date(2024, 2, 1), 31))
+        await asyncio.sleep(0)
+
+        async with fake_db.country_lock("TST"):
+            assert (fake_db.loads, fake_db.saves) == (1, 1)
+        await tick
+
+    async def test_daily_save_holds_country_lock(self, processor, fake_db):
+        """Writers taking the country lock should wait for the daily save"""
+        tick = asyncio.create_task(processor.on_daily(date(2024, 1, 2), 1))
+        await asyncio.sleep(0)
+
+        async with fake_db.country_lock("TST"):
+            assert (fake_db.loads, fake_db.saves) == (1, 1)
+        await tick
+
+    async def test_daily_only_updates_meta(self, processor, fake_db):
+        """A plain day should do one load/save and skip building engines"""
+        await processor.on_daily(date(2024, 1, 2), 1)
+
+        assert not processor.get_status()['engines_initialized']
+        assert (fake_db.loads, fake_db.saves) == (1, 1)
+        assert fake_db.country_data['meta']['current_date']['day'] == 2
+        assert fake_db.country_data['meta']['total_game_days_elapsed'] == 1
+
+    async def test_daily_tick_with_real_db(self, sample_country_data, tmp_path):
+        """The daily tick should write the new date through the real DBService"""
+        db = DBService()
+        db.db_path = tmp_path
+        db.save_country("TST", sample_country_data)
+        processor = TickProcessor("TST", db)
+        try:
+            await processor.on_daily(date(2024, 1, 2), 1)
+        finally:
+            clock_service.unregister_batch_handler(processor.on_tick_batch)
+
+        data = db.load_country("TST")
+        assert data['meta']['current_date'] == {'year': 2024, 'month': 1, 'day': 2}
+        assert data['meta']['total_game_days_elapsed'] == 1
+        assert data['economy'] == sample_country_data['economy']
+
+    async def test_engine_ticks_reuse_catalog_views(self, processor):
+        """Engines rebuilt each tick should share one flattened weapons catalog"""
+        await processor.on_monthly(date(2024, 2, 1), 31)
+        catalog = processor._procurement_engine.catalog
+
+        await processor.on_monthly(date(2024, 3, 1), 60)
+
+        assert processor._procurement_engine.catalog is catalog
+
+
+class TestClockBatchHandlers:
+    """Test ClockService batch handler dispatch"""
+
+    async def test_batch_handler_receives_fired_types(self):
+        """Batch handlers get every tick type fired that day, in order"""
+        clock = ClockService(start_date=date(2024, 12, 31))
+        clock.resume()
+        calls = []
+
+        async def handler(game_date, day_count, tick_types):
+            calls.append((game_date, list(tick_types)))
+
+        clock.register_batch_handler(handler)
+        triggered = await clock.advance_day()
+
+        assert calls == [(
+            date(2025, 1, 1),
+            [TickType.DAILY, TickType.MONTHLY, TickType.QUARTERLY, TickType.YEARLY]
+        )]
+        assert triggered[TickType.YEARLY]
+        assert not triggered[TickType.WEEKLY]
+
+    async def test_batch_handler_errors_are_isolated(self):
+        """A failing batch handler should not stop the others"""
+        clock = ClockService()
+        clock.resume()
+        calls = []
+
+        async def failing(game_date, day_count, tick_types):
+            raise RuntimeError("boom")
+
+        async def handler(game_date, day_count, tick_types):
+            calls.append(day_count)
+
+        clock.register_batch_handler(failing)
+        clock.register_batch_handler(handler)
+        await clock.advance_day()
+
+        assert calls == [1]
+
+    async def test_wait_for_day_wakes_after_handlers(self):
+        """Day waiters should wake only once the day's handlers are done"""
+        clock = ClockService()
+        clock.resume()
+        order = []
+
+        async def handler(game_date, day_count, tick_types):
+            order.append('handler')
+
+        async def waiter():
+            day = await clock.wait_for_day(0)
+            order.append('waiter')
+            return day
+
+        clock.register_batch_handler(handler)
+        task = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        await clock.advance_day()
+
+        assert await task == 1
+        assert order == ['handler', 'waiter']
+        assert await clock.wait_for_day(0) == 1
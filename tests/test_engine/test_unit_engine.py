@@ -5,7 +5,7 @@ import pytest
 import json
 from datetime import datetime, timedelta
 
-from backend.engine.unit_engine import UnitEngine, MovementResult
+from backend.engine.unit_engine import UnitEngine, MovementResult, get_unit_engine
 from backend.models.map import Coordinates
 from backend.models.units import MilitaryUnit, UnitCategory, UnitStatus
 from backend.models.bases import MilitaryBase, BaseType, BaseCapabilities
@@ -244,6 +244,20 @@ class TestUnitEngine:
         assert unit.status == UnitStatus.IDLE
         assert unit.current_base_id == "base_1"
 
+    def test_return_to_base_saves_once(self, unit_engine, setup_map_service, monkeypatch):
+        """Test returning a unit writes the roster a single time."""
+        unit_engine.deploy_unit("aircraft_1", Coordinates(lat=32.0, lng=34.5), instant=True)
+
+        saves = []
+        original_save = setup_map_service.save_units
+        monkeypatch.setattr(setup_map_service, "save_units", lambda ul: (saves.append(ul), original_save(ul)))
+        result, _ = unit_engine.return_to_base("aircraft_1")
+
+        assert result == MovementResult.SUCCESS
+        assert len(saves) == 1
+        setup_map_service.clear_cache()
+        assert unit_engine.get_unit("aircraft_1").status == UnitStatus.RETURNING
+
     # ==================== Transfer Tests ====================
 
     def test_transfer_to_base(self, unit_engine):
@@ -288,7 +302,59 @@ class TestUnitEngine:
         assert unit.status == UnitStatus.DEPLOYED
         assert unit.movement is None
 
-    # ==================== Status Update Tests ====================
+    def test_process_unit_movements_only_arrived(self, unit_engine):
+        """Test that only units past their ETA are completed."""
+        destination = Coordinates(lat=32.0, lng=34.5)
+        unit_engine.deploy_unit("aircraft_1", destination, instant=False)
+        unit_engine.deploy_unit("ground_1", destination, instant=False)
+
+        aircraft_eta = unit_engine.get_unit("aircraft_1").movement.eta
+        completed = unit_engine.process_unit_movements(aircraft_eta)
+
+        assert [c["unit_id"] for c in completed] == ["aircraft_1"]
+        ground = unit_engine.get_unit("ground_1")
+        assert ground.status == UnitStatus.IN_TRANSIT
+        assert ground.fuel_percent == 70
+
+    def test_returning_unit_arrives_at_home_base(self, unit_engine):
+        """Test that a unit sent home ends up idle at its home base."""
+        unit_engine.deploy_unit("aircraft_1", Coordinates(lat=32.0, lng=34.5), instant=True)
+        unit_engine.return_to_base("aircraft_1")
+
+        unit = unit_engine.get_unit("aircraft_1")
+        assert unit.status == UnitStatus.RETURNING
+        completed = unit_engine.process_unit_movements(unit.movement.eta)
+
+        assert completed[0]["status"] == "idle"
+        unit = unit_engine.get_unit("aircraft_1")
+        assert unit.current_base_id == "base_1"
+        assert unit.location.lat == 31.0
+
+    def test_process_unit_movements_picks_up_saved_transit(self, unit_engine, setup_map_service):
+        """Test that units already in transit on disk are processed after a reload."""
+        unit_engine.deploy_unit("aircraft_1", Coordinates(lat=32.0, lng=34.5))
+        eta = unit_engine.get_unit("aircraft_1").movement.eta
+
+        setup_map_service.clear_cache()
+        fresh_engine = UnitEngine("TST")
+
+        completed = fresh_engine.process_unit_movements(eta)
+        assert [c["unit_id"] for c in completed] == ["aircraft_1"]
+
+    def test_process_unit_movements_drops_stopped_units(self, unit_engine, setup_map_service):
+        """Test that a unit halted outside the engine is not completed."""
+        unit_engine.deploy_unit("aircraft_1", Coordinates(lat=32.0, lng=34.5))
+        unit = unit_engine.get_unit("aircraft_1")
+        eta = unit.movement.eta
+
+        unit.status = UnitStatus.DEPLOYED
+        unit.movement = None
+        setup_map_service.update_unit("TST", unit)
+
+        assert unit_engine.process_unit_movements(eta + timedelta(minutes=1)) == []
+        assert unit_engine._moving == {}
+
+    # ==================== Status Update Tests    # ==================== Status Update Tests ====================
 
     def test_update_unit_status(self, unit_engine):
         """Test updating unit stats."""
@@ -318,6 +384,24 @@ class TestUnitEngine:
         assert unit.health_percent == 0
         assert unit.status == UnitStatus.DESTROYED
 
+    def test_update_unit_status_bulk(self, unit_engine, setup_map_service, monkeypatch):
+        """Test bulk stat updates clamp values and save once."""
+        saves = []
+        original_save = setup_map_service.save_units
+        monkeypatch.setattr(setup_map_service, "save_units", lambda ul: (saves.append(ul), original_save(ul)))
+
+        results = unit_engine.update_unit_status_bulk({
+            "aircraft_1": {"health_delta": -10, "fuel_delta": 50},
+            "ground_1": {"health_delta": -100},
+            "nonexistent": {"health_delta": -10}
+        })
+
+        assert len(saves) == 1
+        assert set(results) == {"aircraft_1", "ground_1"}
+        assert results["aircraft_1"]["health"] == 85
+        assert results["aircraft_1"]["fuel"] == 100
+        assert unit_engine.get_unit("ground_1").status == UnitStatus.DESTROYED
+
     # ==================== Resupply Tests ====================
 
     def test_resupply_unit_at_base(self, unit_engine):
@@ -420,3 +504,11 @@ class TestUnitEngineCalculations:
         # Ground units consume 2% per hour
         fuel = engine._calculate_fuel_consumption(unit, 5)  # 5 hours
         assert fuel == 10.0  # 2% * 5 = 10%
+
+    def test_get_unit_engine_is_shared(self):
+        """Test that unit engines are cached per country."""
+        engine = get_unit_engine("tst")
+
+        assert engine.country_code == "TST"
+        assert get_unit_engine("TST") is engine
+        assert get_unit_engine("ISR") is not engine
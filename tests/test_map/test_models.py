@@ -2,10 +2,13 @@
 Tests for map-related data models.
 """
 import pytest
-from backend.models.map import Coordinates, BoundingBox, MapRegion, TerrainType
+from datetime import datetime
+
+from backend.models.map import Coordinates, BoundingBox, MapRegion, TerrainType, filter_in_radius, haversine_km
 from backend.models.cities import City, CityList, CityType, CityInfrastructure
 from backend.models.bases import MilitaryBase, BaseList, BaseType, BaseStatus, BaseCapabilities
 from backend.models.units import MilitaryUnit, UnitList, UnitCategory, UnitStatus
+from backend.models.active_operation import ActiveOperation, OperationsList, OperationStatus, OperationType
 
 
 class TestCoordinates:
@@ -46,6 +49,24 @@ class TestCoordinates:
 
         assert coord1.distance_to(coord2) == pytest.approx(coord2.distance_to(coord1), rel=0.01)
 
+    def test_distance_matches_haversine_km(self):
+        """Test that distance_to and haversine_km agree."""
+        coord1 = Coordinates(lat=31.7683, lng=35.2137)
+        coord2 = Coordinates(lat=32.0853, lng=34.7818)
+
+        assert coord1.distance_to(coord2) == haversine_km(31.7683, 35.2137, 32.0853, 34.7818)
+
+    def test_filter_in_radius_matches_haversine(self):
+        """Test radius filtering agrees with haversine_km, up to half the globe."""
+        center = Coordinates(lat=31.5, lng=35.0)
+        points = [
+            Coordinates(lat=lat, lng=lng)
+            for lat in range(-85, 90, 17) for lng in range(-175, 180, 23)
+        ]
+        for radius in [50, 500, 3000, 10000, 20015, 25000]:
+            expected = [p for p in points if haversine_km(center.lat, center.lng, p.lat, p.lng) <= radius]
+            assert filter_in_radius(center, radius, points, lambda p: p) == expected
+
 
 class TestBoundingBox:
     """Tests for BoundingBox model."""
@@ -155,6 +176,17 @@ class TestCityList:
         city = sample_cities.get_by_id("nonexistent")
         assert city is None
 
+    def test_get_by_id_after_list_changes(self, sample_cities):
+        """Test city lookups stay correct when the cities list is modified."""
+        assert sample_cities.index_of("port") == 1
+
+        capital = sample_cities.cities.pop(0)
+        assert sample_cities.index_of("port") == 0
+        assert sample_cities.get_by_id("capital") is None
+
+        sample_cities.cities.append(capital)
+        assert sample_cities.get_by_id("capital") is capital
+
     def test_get_cities_in_radius(self, sample_cities):
         """Test getting cities in radius."""
         center = Coordinates(lat=31.5, lng=34.75)
@@ -232,6 +264,25 @@ class TestBaseList:
         operational = sample_bases.get_operational()
         assert len(operational) == 2  # One is in maintenance
 
+    def test_get_by_id_after_list_changes(self, sample_bases):
+        """Test ID lookups stay correct when the bases list is modified."""
+        assert sample_bases.get_by_id("air_2").name == "Air Base 2"
+        assert sample_bases.get_by_id("missing") is None
+
+        removed = sample_bases.bases.pop(0)
+        assert sample_bases.index_of("air_2") == 1
+
+        sample_bases.bases.append(removed)
+        assert sample_bases.get_by_id("air_1") is removed
+
+    def test_get_bases_in_radius_matches_haversine(self, sample_bases):
+        """Test the radius prefilter keeps exactly the bases haversine does."""
+        center = Coordinates(lat=31.0, lng=35.0)
+        for radius in (0, 50, 75, 120, 150):
+            expected = [b.id for b in sample_bases.bases if center.distance_to(b.location) <= radius]
+            found = [b.id for b in sample_bases.get_bases_in_radius(center, radius)]
+            assert found == expected
+
 
 class TestMilitaryUnit:
     """Tests for MilitaryUnit model."""
@@ -323,6 +374,29 @@ class TestMilitaryUnit:
         # All other factors are 1.0
         assert unit.get_effective_strength() == pytest.approx(1.0, rel=0.01)
 
+    def test_effective_strength_partial(self):
+        """Test each factor scales strength, with supply limited by fuel or ammo."""
+        unit = MilitaryUnit(
+            id="unit_1",
+            name="Test Unit",
+            country_code="TST",
+            unit_type="Tank",
+            category=UnitCategory.GROUND,
+            quantity=10,
+            location=Coordinates(lat=31.0, lng=35.0),
+            home_base_id="base_1",
+            health_percent=80,
+            readiness_percent=50,
+            fuel_percent=90,
+            ammo_percent=40,
+            morale=60,
+            experience_level=0
+        )
+        assert unit.get_effective_strength() == pytest.approx(0.8 * 0.5 * 0.4 * 0.6 * 0.5)
+
+        unit.fuel_percent = 10
+        assert unit.get_effective_strength() == pytest.approx(0.8 * 0.5 * 0.1 * 0.6 * 0.5)
+
 
 class TestUnitList:
     """Tests for UnitList model."""
@@ -373,6 +447,38 @@ class TestUnitList:
             ]
         )
 
+    def test_get_by_id(self, sample_units):
+        """Test getting units by ID."""
+        assert sample_units.get_by_id("ground_1").name == "Tank Brigade"
+        assert sample_units.get_by_id("missing") is None
+
+    def test_from_raw(self, sample_units):
+        """Test building a unit list from raw dicts validates every unit."""
+        raw = [u.model_dump(mode="json") for u in sample_units.units]
+        units = UnitList.from_raw("TST", raw)
+
+        assert units.units == sample_units.units
+        assert units.get_by_id("air_2").status == UnitStatus.MAINTENANCE
+
+        raw[1]["health_percent"] = 150
+        with pytest.raises(ValueError):
+            UnitList.from_raw("TST", raw)
+
+    def test_dump_all(self, sample_units):
+        """Test dumping the whole list matches dumping each unit."""
+        assert UnitList.dump_all(sample_units.units) == [u.model_dump() for u in sample_units.units]
+        assert UnitList.dump_all([]) == []
+
+    def test_get_by_id_after_list_changes(self, sample_units):
+        """Test ID lookups stay correct when the units list is modified."""
+        assert sample_units.index_of("air_2") == 2
+
+        removed = sample_units.units.pop(0)
+        assert sample_units.index_of("air_2") == 1
+
+        sample_units.units.append(removed)
+        assert sample_units.get_by_id("air_1") is removed
+
     def test_get_by_category(self, sample_units):
         """Test getting units by category."""
         aircraft = sample_units.get_by_category(UnitCategory.AIRCRAFT)
@@ -388,13 +494,83 @@ class TestUnitList:
         # air_2 is in maintenance with low health
         assert len(available) == 2
 
+    def test_get_available_matches_can_deploy(self, sample_units):
+        """Test the availability filter agrees with can_deploy unit by unit."""
+        for status in UnitStatus:
+            for field in ("health_percent", "readiness_percent", "fuel_percent", "ammo_percent"):
+                for value in (19.9, 20, 49.9, 50):
+                    unit = sample_units.units[0].model_copy(update={"status": status, field: value})
+                    units = UnitList(country_code="TST", units=[unit])
+                    assert (units.get_available() == [unit]) is unit.can_deploy()
+
     def test_get_at_base(self, sample_units):
         """Test getting units at base."""
         at_base_1 = sample_units.get_at_base("base_1")
         assert len(at_base_1) == 2  # Both aircraft are at base_1
 
+    def test_get_in_radius(self, sample_units):
+        """Test getting units within a radius."""
+        center = Coordinates(lat=31.0, lng=35.0)
+
+        assert [u.id for u in sample_units.get_in_radius(center, 10)] == ["air_1"]
+        assert len(sample_units.get_in_radius(center, 100)) == 2
+        assert len(sample_units.get_in_radius(center, 150)) == 3
+
+    def test_get_in_radius_matches_haversine(self, sample_units):
+        """Test the bounding-box prefilter agrees with a plain distance scan."""
+        for lat, lng in [(31.0, 35.0), (88.0, 0.0), (-40.0, 179.9), (0.0, -179.9)]:
+            for unit in sample_units.units:
+                unit.location = Coordinates(lat=lat + 0.3, lng=-lng if abs(lng) > 179 else lng + 0.4)
+            center = Coordinates(lat=lat, lng=lng)
+            for radius in (1, 50, 500):
+                expected = [u for u in sample_units.units if center.distance_to(u.location) <= radius]
+                assert sample_units.get_in_radius(center, radius) == expected
+
     def test_get_in_operation(self, sample_units):
         """Test getting units in operation."""
         in_op = sample_units.get_in_operation("op_1")
         assert len(in_op) == 1
         assert in_op[0].id == "ground_1"
+
+
+class TestOperationsList:
+    """Tests for OperationsList model."""
+
+    @pytest.fixture
+    def sample_operations(self):
+        """Create sample operations list."""
+        def op(op_id, lat, lng, status):
+            return ActiveOperation(
+                id=op_id,
+                name=op_id,
+                country_code="TST",
+                operation_type=OperationType.AIR_STRIKE,
+                status=status,
+                created_at=datetime(2024, 1, 1),
+                origin_location=Coordinates(lat=31.0, lng=35.0),
+                target_location=Coordinates(lat=lat, lng=lng)
+            )
+
+        return OperationsList(
+            country_code="TST",
+            operations=[
+                op("op_near", 33.0, 35.5, OperationStatus.ACTIVE),
+                op("op_far", 36.0, 38.0, OperationStatus.PLANNING),
+                op("op_done", 33.0, 35.5, OperationStatus.COMPLETED)
+            ]
+        )
+
+    def test_get_targeting_location(self, sample_operations):
+        """Test only active operations near the location are returned."""
+        center = Coordinates(lat=33.0, lng=35.4)
+
+        near = sample_operations.get_targeting_location(center, 50)
+        assert [op.id for op in near] == ["op_near"]
+
+        wide = sample_operations.get_targeting_location(center, 1000)
+        assert [op.id for op in wide] == ["op_near", "op_far"]
+
+    def test_get_completed(self, sample_operations):
+        """Test completed operations are separated from active ones."""
+        assert [op.id for op in sample_operations.get_completed()] == ["op_done"]
+        assert [op.id for op in sample_operations.get_active()] == ["op_near", "op_far"]
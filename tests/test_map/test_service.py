@@ -4,6 +4,7 @@ Tests for map service.
 import pytest
 import json
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 from backend.services.map_service import MapService
@@ -11,6 +12,7 @@ from backend.models.map import Coordinates
 from backend.models.cities import City, CityList, CityType
 from backend.models.bases import MilitaryBase, BaseList, BaseType
 from backend.models.units import MilitaryUnit, UnitList, UnitCategory, UnitStatus
+from backend.models.active_operation import ActiveOperation, OperationsList, OperationType
 
 
 class TestMapService:
@@ -122,6 +124,17 @@ class TestMapService:
         assert cities.cities[0].id == "city_1"
         assert cities.cities[0].is_capital is True
 
+    def test_load_cities_default_type(self, map_service, sample_cities_data):
+        """Test cities without a city_type load as medium cities."""
+        del sample_cities_data["cities"][1]["city_type"]
+        sample_cities_data["cities"][1]["infrastructure"] = {"power_reliability": 40}
+        with open(map_service.map_path / "cities_TST.json", "w") as f:
+            json.dump(sample_cities_data, f)
+
+        city = map_service.load_cities("TST").cities[1]
+        assert city.city_type == CityType.MEDIUM
+        assert city.infrastructure.power_reliability == 40
+
     def test_save_cities(self, map_service):
         """Test saving cities."""
         city_list = CityList(
@@ -202,6 +215,25 @@ class TestMapService:
         file_path = map_service.map_path / "bases_TST.json"
         assert file_path.exists()
 
+    def test_compact_save_round_trips(self, map_service, monkeypatch):
+        """Test compact saves are single-line and load back unchanged."""
+        from backend import config
+        monkeypatch.setattr(config.config, "DB_PRETTY_JSON", False)
+        base = MilitaryBase(
+            id="new_base",
+            name="Baça Base",
+            country_code="TST",
+            location=Coordinates(lat=31.0, lng=35.0),
+            base_type=BaseType.NAVAL_BASE
+        )
+        map_service.save_bases(BaseList(country_code="TST", bases=[base]))
+
+        text = (map_service.map_path / "bases_TST.json").read_text(encoding="utf-8")
+        assert "\n" not in text
+
+        map_service.clear_cache()
+        assert map_service.load_bases("TST").bases == [base]
+
     # ==================== Units Tests ====================
 
     def test_load_units_from_file(self, map_service, sample_units_data):
@@ -215,6 +247,25 @@ class TestMapService:
         assert units.units[0].id == "unit_1"
         assert units.units[0].category == UnitCategory.AIRCRAFT
 
+    def test_load_units_fills_defaults(self, map_service, sample_units_data):
+        """Test units without a category or status get the loader defaults."""
+        del sample_units_data["units"][0]["category"]
+        del sample_units_data["units"][0]["status"]
+        with open(map_service.map_path / "units_TST.json", "w") as f:
+            json.dump(sample_units_data, f)
+
+        unit = map_service.load_units("TST").units[0]
+        assert unit.category == UnitCategory.GROUND
+        assert unit.status == UnitStatus.IDLE
+        assert isinstance(unit.location, Coordinates)
+
+    def test_load_units_missing_file_is_cached(self, map_service):
+        """Test that an empty roster is cached and shared between calls."""
+        first = map_service.load_units("NONEXISTENT")
+
+        assert first.units == []
+        assert map_service.load_units("NONEXISTENT") is first
+
     def test_update_unit(self, map_service, sample_units_data):
         """Test updating a unit."""
         file_path = map_service.map_path / "units_TST.json"
@@ -235,6 +286,74 @@ class TestMapService:
         assert updated.status == UnitStatus.DEPLOYED
         assert updated.location.lat == 32.0
 
+    def test_update_units_bulk_saves_once(self, map_service, sample_units_data, monkeypatch):
+        """Test bulk unit update writes the unit file a single time."""
+        sample_units_data["units"].append(dict(sample_units_data["units"][0], id="unit_2"))
+        with open(map_service.map_path / "units_TST.json", "w") as f:
+            json.dump(sample_units_data, f)
+
+        units = map_service.load_units("TST").units
+        for unit in units:
+            unit.status = UnitStatus.DEPLOYED
+
+        saves = []
+        original_save = map_service.save_units
+        monkeypatch.setattr(map_service, "save_units", lambda ul: (saves.append(ul), original_save(ul)))
+        map_service.update_units_bulk("TST", units)
+
+        assert len(saves) == 1
+        map_service.clear_cache("TST")
+        assert [u.status for u in map_service.load_units("TST").units] == [UnitStatus.DEPLOYED] * 2
+
+    # ==================== Borders Tests ====================
+
+    def test_neighbor_data_parsed_with_borders(self, map_service):
+        """Test neighbor data is cached with the borders and refreshed on clear."""
+        borders = {
+            "country_code": "TST",
+            "name": "Testland",
+            "bounding_box": {"north": 33.0, "south": 29.5, "east": 35.9, "west": 34.2},
+            "center": {"lat": 31.5, "lng": 35.0},
+            "land_area_km2": 22000,
+            "neighbors": ["NBR"],
+            "neighbor_data": [{"country_code": "NBR", "name": "Neighbor"}]
+        }
+        file_path = map_service.map_path / "borders_TST.json"
+        file_path.write_text(json.dumps(borders), encoding="utf-8")
+
+        assert map_service.get_neighbor_data("TST") == borders["neighbor_data"]
+        assert map_service.load_borders("TST").neighbors == ["NBR"]
+
+        borders["neighbor_data"] = []
+        file_path.write_text(json.dumps(borders), encoding="utf-8")
+        assert len(map_service.get_neighbor_data("TST")) == 1
+
+        map_service.clear_cache("TST")
+        assert map_service.get_neighbor_data("TST") == []
+        assert map_service.get_neighbor_data("NONEXISTENT") == []
+
+    # ==================== Operations Tests ====================
+
+    def test_operations_round_trip(self, map_service):
+        """Test saved operations load back with their dates and locations."""
+        operation = ActiveOperation(
+            id="op_1",
+            name="Test Op",
+            country_code="TST",
+            operation_type=OperationType.RECONNAISSANCE,
+            created_at=datetime(2026, 1, 2, 22, 38, 28, 782083),
+            started_at=datetime(2026, 1, 3, 6, 0),
+            origin_location=Coordinates(lat=31.2, lng=34.7),
+            target_location=Coordinates(lat=33.5, lng=36.3),
+            assigned_unit_ids=["unit_1"]
+        )
+        map_service.save_operations(OperationsList(country_code="TST", operations=[operation]))
+
+        map_service.clear_cache()
+        loaded = map_service.load_operations("TST")
+        assert loaded.operations == [operation]
+        assert loaded.get_by_id("op_1").started_at == datetime(2026, 1, 3, 6, 0)
+
     # ==================== Full Map Data Tests ====================
 
     def test_get_full_map_data(self, map_service, sample_cities_data, sample_bases_data, sample_units_data):
@@ -254,6 +373,34 @@ class TestMapService:
         assert len(data["bases"]) == 1
         assert len(data["units"]) == 1
 
+    def test_full_map_data_reuses_static_dumps(self, map_service, sample_cities_data):
+        """Test city dumps are reused until the cities are saved again."""
+        with open(map_service.map_path / "cities_TST.json", "w") as f:
+            json.dump(sample_cities_data, f)
+
+        first = map_service.get_full_map_data("TST")
+        assert map_service.get_full_map_data("TST")["cities"] is first["cities"]
+
+        city_list = map_service.load_cities("TST")
+        renamed = city_list.cities[0].model_copy(update={"name": "Renamed"})
+        map_service.save_cities(CityList(country_code="TST", cities=[renamed]))
+
+        cities = map_service.get_full_map_data("TST")["cities"]
+        assert [c["name"] for c in cities] == ["Renamed"]
+
+    def test_full_map_data_after_in_place_city_edit(self, map_service, sample_cities_data):
+        """Test saving the edited cached city list refreshes the city dump."""
+        with open(map_service.map_path / "cities_TST.json", "w") as f:
+            json.dump(sample_cities_data, f)
+        map_service.get_full_map_data("TST")
+
+        city_list = map_service.load_cities("TST")
+        city_list.cities[0].population = 1
+        map_service.save_cities(city_list)
+
+        cities = map_service.get_full_map_data("TST")["cities"]
+        assert cities[0]["population"] == 1
+
     # ==================== Cache Tests ====================
 
     def test_cache_is_used(self, map_service, sample_cities_data):
@@ -294,3 +441,41 @@ class TestMapService:
         # Second load should read from file
         cities2 = map_service.load_cities("TST")
         assert cities2.cities[0].name == "Modified Name"
+
+    def test_cache_evicts_least_recently_used(self, map_service, sample_cities_data, monkeypatch):
+        """Test that the cache keeps at most MAP_CACHE_SIZE countries."""
+        from backend import config
+        monkeypatch.setattr(config.config, "MAP_CACHE_SIZE", 2)
+        for code in ("AAA", "BBB", "CCC"):
+            with open(map_service.map_path / f"cities_{code}.json", "w") as f:
+                json.dump(dict(sample_cities_data, country_code=code), f)
+
+        map_service.load_cities("AAA")
+        map_service.load_cities("BBB")
+        map_service.load_cities("AAA")  # AAA is now most recently used
+        map_service.load_cities("CCC")
+
+        assert list(map_service._cities_cache) == ["AAA", "CCC"]
+
+    def test_batch_writes_saves_once(self, map_service, sample_units_data, monkeypatch):
+        """Test that saves inside a batch are written once when it ends."""
+        with open(map_service.map_path / "units_TST.json", "w") as f:
+            json.dump(sample_units_data, f)
+
+        writes = []
+        write_json = map_service._write_json
+        monkeypatch.setattr(
+            map_service, "_write_json",
+            lambda path, data: (writes.append(path), write_json(path, data))
+        )
+
+        units = map_service.load_units("TST").units
+        with map_service.batch_writes():
+            for unit in units:
+                unit.health_percent = 50
+                map_service.update_unit("TST", unit)
+            assert writes == []
+
+        assert len(writes) == 1
+        map_service.clear_cache()
+        assert all(u.health_percent == 50 for u in map_service.load_units("TST").units)
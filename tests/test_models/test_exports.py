@@ -0,0 +1,31 @@
+# tests/test_models/test_exports.py
+import pytest
+
+import backend.models as models
+
+
+class TestLazyExports:
+    """Test the package-level model re-exports"""
+
+    def test_every_export_resolves(self):
+        """Each name in __all__ should load from its submodule"""
+        from backend.models.country import CountryState
+        from backend.models.sectors import SECTORS
+
+        assert models.CountryState is CountryState
+        assert models.SECTORS is SECTORS
+        for name in models.__all__:
+            assert getattr(models, name) is not None
+
+    def test_star_import(self):
+        """Star imports should still pull in the country schema"""
+        namespace = {}
+        exec("from backend.models import *", namespace)
+
+        assert 'Indices' in namespace
+        assert 'BilateralRelation' in namespace
+
+    def test_unknown_name(self):
+        """Names that are not exported should raise AttributeError"""
+        with pytest.raises(AttributeError):
+            models.NotAModel
@@ -0,0 +1,185 @@
+"""
+Tests for database service.
+"""
+import asyncio
+import threading
+from collections import OrderedDict
+
+import pytest
+
+from backend.config import config
+from backend.services.db_service import DBService
+
+
+class TestDBService:
+    """Tests for DBService."""
+
+    @pytest.fixture
+    def db_service(self, tmp_path):
+        """Create DBService over a temporary database directory."""
+        (tmp_path / "countries").mkdir()
+        service = DBService()
+        service.db_path = tmp_path
+        return service
+
+    def test_save_and_load_country(self, db_service):
+        """Saved country state should load back unchanged."""
+        data = {"meta": {"country_code": "TST"}, "economy": {"gdp_billions_usd": 400}}
+        db_service.save_country("tst", data)
+
+        assert db_service.load_country("TST") == data
+
+    def test_load_missing_country(self, db_service):
+        """Loading an unknown country should raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            db_service.load_country("XXX")
+
+    def test_read_country_reuses_parse_until_saved(self, db_service):
+        """Read-only loads should share one parse until the file changes."""
+        db_service.save_country("TST", {"meta": {"country_code": "TST"}})
+
+        version, first = db_service.read_country_versioned("tst")
+        assert db_service.read_country("TST") is first
+
+        db_service.save_country("TST", {"meta": {"country_code": "TST", "day": 2}})
+        new_version, second = db_service.read_country_versioned("TST")
+
+        assert second is not first
+        assert second["meta"]["day"] == 2
+        assert new_version != version
+
+    def test_peek_country_only_returns_current_parse(self, db_service):
+        """Peeking should never parse, and should miss after a save."""
+        db_service.save_country("TST", {"meta": {"country_code": "TST"}})
+        assert db_service.peek_country_versioned("TST") is None
+
+        entry = db_service.read_country_versioned("TST")
+        assert db_service.peek_country_versioned("tst") is entry
+
+        db_service.save_country("TST", {"meta": {"country_code": "TST", "day": 2}})
+        assert db_service.peek_country_versioned("TST") is None
+        with pytest.raises(FileNotFoundError):
+            db_service.peek_country_versioned("XXX")
+
+    async def test_threaded_save_during_read_on_loop(self, db_service):
+        """A save popping the entry mid-lookup should not break the read."""
+        db_service.save_country("TST", {"meta": {"day": 1}})
+        db_service.read_country("TST")
+        saver = threading.Thread(target=db_service.save_country, args=("TST", {"meta": {"day": 2}}))
+
+        class InterleavingCache(OrderedDict):
+            """Runs the save between the lookup and move_to_end."""
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                if saver.ident is None:
+                    saver.start()
+                    saver.join(timeout=0.1)  # Waits out the save unless it is locked out
+                return value
+
+        db_service._read_cache = InterleavingCache(db_service._read_cache)
+        assert db_service.read_country("TST") == {"meta": {"day": 1}}
+
+        saver.join()
+        assert db_service.read_country("TST") == {"meta": {"day": 2}}
+
+    async def test_reads_on_loop_interleaved_with_threaded_saves(self, db_service):
+        """Reads on the loop should keep working while saves run in threads."""
+        db_service.save_country("TST", {"meta": {"day": 0}})
+
+        async def save_days():
+            for day in range(1, 51):
+                await asyncio.to_thread(db_service.save_country, "TST", {"meta": {"day": day}})
+
+        async def read_days():
+            days = []
+            for _ in range(200):
+                days.append(db_service.read_country("TST")["meta"]["day"])
+                await asyncio.sleep(0)
+            return days
+
+        _, days = await asyncio.gather(save_days(), read_days())
+
+        assert days == sorted(days)
+        assert db_service.read_country("TST") == {"meta": {"day": 50}}
+
+    def test_read_missing_country(self, db_service):
+        """Read-only loads of an unknown country should raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            db_service.read_country("XXX")
+
+    def test_read_cache_evicts_least_recently_used(self, db_service, monkeypatch):
+        """The read cache should stay bounded, dropping the stalest country."""
+        monkeypatch.setattr(config, "DB_READ_CACHE_SIZE", 2)
+        for code in ("AAA", "BBB", "CCC"):
+            db_service.save_country(code, {"meta": {"country_code": code}})
+
+        first = db_service.read_country("AAA")
+        db_service.read_country("BBB")
+        assert db_service.read_country("AAA") is first
+        db_service.read_country("CCC")
+
+        assert list(db_service._read_cache) == ["AAA", "CCC"]
+        assert db_service.read_country("AAA") is first
+
+    def test_compact_save_round_trips(self, db_service, monkeypatch):
+        """Compact saves should be single-line and load back unchanged."""
+        monkeypatch.setattr(config, "DB_PRETTY_JSON", False)
+        data = {"meta": {"country_code": "TST", "name": "Tëst"}, "economy": {"gdp_billions_usd": 400}}
+        db_service.save_country("TST", data)
+
+        text = (db_service.db_path / "countries" / "TST.json").read_text(encoding="utf-8")
+        assert "\n" not in text
+        assert db_service.load_country("TST") == data
+
+    def test_save_leaves_no_temp_files(self, db_service):
+        """Atomic saves should replace the file and clean up after themselves."""
+        db_service.save_country("TST", {"meta": {"day": 1}})
+        db_service.save_country("TST", {"meta": {"day": 2}})
+
+        files = [p.name for p in (db_service.db_path / "countries").iterdir()]
+        assert files == ["TST.json"]
+        assert db_service.load_country("TST") == {"meta": {"day": 2}}
+
+    def test_compact_game_state_round_trips(self, db_service, monkeypatch):
+        """Game state should follow DB_PRETTY_JSON and load back the same."""
+        monkeypatch.setattr(config, "DB_PRETTY_JSON", False)
+        state = {"paused": True, "speed": 2, "current_date": {"year": 2024, "month": 3, "day": 9}}
+        db_service.save_game_state(state)
+
+        assert "\n" not in (db_service.db_path / "game_state.json").read_text(encoding="utf-8")
+        assert db_service.load_game_state() == state
+
+    def test_save_game_state_is_atomic(self, db_service, monkeypatch):
+        """A failed game state save should keep the previous file intact."""
+        db_service.save_game_state({"paused": True, "speed": 1})
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("os.replace", failing_replace)
+        with pytest.raises(OSError):
+            db_service.save_game_state({"paused": False, "speed": 3})
+
+        assert sorted(p.name for p in db_service.db_path.iterdir()) == ["countries", "game_state.json"]
+        assert db_service.load_game_state() == {"paused": True, "speed": 1}
+
+    def test_read_catalog_reuses_parse_until_changed(self, db_service):
+        """Catalog reads should share one parse until the file changes."""
+        catalog_dir = db_service.db_path / "catalog"
+        catalog_dir.mkdir()
+        catalog_file = catalog_dir / "weapons_catalog.json"
+        catalog_file.write_text('{"weapons": {"F-35": {"name": "F-35"}}}', encoding="utf-8")
+
+        first = db_service.read_weapons_catalog()
+        assert db_service.read_weapons_catalog() is first
+
+        catalog_file.write_text('{"weapons": {"F-16": {"name": "F-16"}, "F-35": {"name": "F-35"}}}', encoding="utf-8")
+        second = db_service.read_weapons_catalog()
+
+        assert second is not first
+        assert set(second["weapons"]) == {"F-16", "F-35"}
+
+    def test_read_missing_catalogs(self, db_service):
+        """Missing weapons and events catalogs should read as empty."""
+        assert db_service.read_weapons_catalog() == {}
+        assert db_service.read_events_catalog() == {}
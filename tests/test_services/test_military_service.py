@@ -0,0 +1,60 @@
+"""
+Tests for military service.
+"""
+from datetime import datetime
+
+import pytest
+
+from backend.config import config
+from backend.models.border_deployment import (
+    BorderDeploymentList,
+    BorderDeploymentZone,
+    DeploymentAlertLevel,
+)
+from backend.models.map import Coordinates
+from backend.services.military_service import MilitaryService
+
+
+class TestDeploymentPersistence:
+    """Tests for saving and loading deployment zones."""
+
+    @pytest.fixture
+    def military_service(self, tmp_path):
+        """Create MilitaryService over a temporary map directory."""
+        service = MilitaryService()
+        service.db_path = tmp_path
+        service.map_path = tmp_path / "map"
+        return service
+
+    @pytest.fixture
+    def deployments(self):
+        """A deployment list with one zone."""
+        return BorderDeploymentList(
+            country_code="TST",
+            zones=[
+                BorderDeploymentZone(
+                    id="bdz_TST_NBR",
+                    country_code="TST",
+                    neighbor_code="NBR",
+                    name="Border - Neighbor",
+                    center=Coordinates(lat=33.1, lng=35.3),
+                    active_troops=1500,
+                    alert_level=DeploymentAlertLevel.ELEVATED,
+                    last_incident=datetime(2026, 1, 2, 22, 38, 28)
+                )
+            ]
+        )
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_save_and_load_round_trip(self, military_service, deployments, monkeypatch, pretty):
+        """Saved zones should load back unchanged in either output style."""
+        monkeypatch.setattr(config, "DB_PRETTY_JSON", pretty)
+        military_service.save_deployments(deployments)
+
+        text = (military_service.map_path / "deployments_TST.json").read_text(encoding="utf-8")
+        assert ("\n" in text) is pretty
+
+        military_service._deployments_cache.clear()
+        loaded = military_service.load_deployments("TST")
+        assert loaded.zones == deployments.zones
+        assert loaded.total_active_deployed == 1500